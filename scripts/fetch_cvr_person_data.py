@@ -9,17 +9,23 @@ hits are skipped on purpose to avoid false attribution.
 from __future__ import annotations
 
 import argparse
+import atexit
 import html
 import json
+import os
+import queue
 import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote, urlencode
 from urllib.request import Request, urlopen
@@ -27,6 +33,11 @@ from urllib.request import Request, urlopen
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the stdlib encoder writes the same JSON.
+    orjson = None
+
 
 ROOT = Path(__file__).parent.parent
 DATA_DIR = ROOT / "data"
@@ -35,16 +46,27 @@ OUTPUT_FILE = DATA_DIR / "cvr_personer.json"
 HVERV_FILE = DATA_DIR / "hverv.json"
 OVERRIDES_FILE = DATA_DIR / "cvr_person_overrides.json"
 LOCAL_OVERRIDES_FILE = ROOT / "LOCAL_CVR_OVERRIDES.json"
+TEXT_CACHE_FILE = DATA_DIR / ".cvr_tekst_cache.json"
 
 CVR_BASE_URL = "https://datacvr.virk.dk"
 ODA_ACTOR_URL = "https://oda.ft.dk/api/Akt%C3%B8r"
 DEBUG_PORT = 9235
+CDP_URL = f"http://127.0.0.1:{DEBUG_PORT}"
+CDP_STARTUP_TIMEOUT = 30.0
+CDP_POLL_INTERVAL = 0.1
+# Only the origin matters for the in-page fetch() calls, not the page assets,
+# but a slow Virk load still needs time to commit to that origin.
+PAGE_READY_TIMEOUT_MS = 60000
 DEFAULT_DELAY = 0.15
+DEFAULT_CONCURRENCY = 4
 ODA_TIMEOUT = 60
 ODA_MAX_RETRIES = 3
 CVR_SEARCH_DELAY = 0.35
 CVR_SEARCH_MAX_RETRIES = 4
 CVR_RATE_LIMIT_SLEEP = 4.0
+SEARCH_BATCH_SIZE = 8
+SEARCH_MAX_IN_FLIGHT = 4
+TEXT_CACHE_MAX_AGE = 24 * 60 * 60
 
 DEFAULT_CHROME_PATHS = (
     Path(r"C:\Program Files\Google\Chrome\Application\chrome.exe"),
@@ -52,6 +74,20 @@ DEFAULT_CHROME_PATHS = (
     Path(r"C:\Program Files\Chromium\Application\chrome.exe"),
 )
 
+# Nobody watches this window and only /gateway JSON is read, so keep the
+# renderer from throttling itself in the background and skip image decoding.
+CHROME_BACKGROUND_FLAGS = (
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-features=TranslateUI",
+    "--blink-settings=imagesEnabled=false",
+)
+CHROME_HEADLESS_FLAGS = (
+    "--headless=new",
+    "--disable-gpu",
+)
+
 STATUS_LABELS = {
     "NORMAL": "Normal",
     "OPHOERT": "Ophoert",
@@ -89,6 +125,22 @@ COMPANY_SUFFIX_TOKEN_PATTERN = re.compile(
     r"\b(?:ApS|A/S|I/S|K/S|P/S|IVS|AMBA|FMBA|SMBA|Inc\.?|Ltd\.?|AB|ehf\.?)\b\.?",
     re.IGNORECASE,
 )
+WHITESPACE_PATTERN = re.compile(r"\s+")
+NAME_TOKEN_PATTERN = re.compile(r"[0-9a-zA-Z\u00C0-\u017F-]+")
+LOOSE_SEPARATOR_PATTERN = re.compile(r"[^0-9a-zA-Z\u00C0-\u017F]+")
+STATUS_SLUG_STRIP_PATTERN = re.compile(r"[^A-Z_]")
+# Names and hverv text are almost all Latin-1/Latin Extended-A. For those code
+# points the diacritic fold is precomputed from unicodedata, so str.translate
+# gives the exact NFKD + strip-combining result without a Python-level loop.
+LATIN_FOLD_LIMIT = "\u0250"
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+BIRTH_ANNOTATION_PATTERN = re.compile(r"\s*\((?:f(?:ø|oe)dt)[^)]+\)", re.IGNORECASE)
+MEMBER_DATA_PATTERN = re.compile(r"<memberData>(.*?)</memberData>", re.IGNORECASE | re.DOTALL)
+# Do not stop on periods inside initials like "Steffen W. Frølund."
+OFFICIAL_NAME_PATTERN = re.compile(
+    r"^(.*?)(?:(?:,\s*|\s+)f(?:ø|oe)dt\b|(?:,\s*|\s+)bosiddende\b|(?:,\s*|\s+)datter af\b|(?:,\s*|\s+)søn af\b|(?:,\s*|\s+)son af\b|;|$)",
+    re.IGNORECASE,
+)
 COMPANY_PREFIXES = (
     "bestyrelsesmedlem i ",
     "bestyrelsesmedlem ",
@@ -104,14 +156,142 @@ COMPANY_PREFIXES = (
     "konsulentvirksomhed ",
     "virksomhed ",
 )
+# Alternatives keep the tuple order, so the first listed prefix still wins.
+COMPANY_PREFIX_PATTERN = re.compile("|".join(re.escape(prefix) for prefix in COMPANY_PREFIXES))
 
 SEARCH_CACHE: dict[str, dict[str, Any]] = {}
+# Caps Virk searches in flight across all workers, and lets a 429 seen by one
+# worker pause the others too.
+SEARCH_SLOTS = threading.BoundedSemaphore(SEARCH_MAX_IN_FLIGHT)
+SEARCH_BACKOFF_LOCK = threading.Lock()
+search_backoff_until = 0.0
+PERSON_DETAIL_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
+
+# Requests go through the page's own fetch() so they carry the real Chrome
+# session (cookies, TLS fingerprint) that Virk's gateway expects.
+FETCH_JSON_SCRIPT = """
+async ({ path, method, payload }) => {
+  const options = { method, headers: {} };
+  if (payload !== null) {
+    options.headers["content-type"] = "application/json";
+    options.body = JSON.stringify(payload);
+  }
+  const response = await fetch(path, options);
+  if (!response.ok) {
+    throw new Error(`${response.status} ${response.statusText}`);
+  }
+  return await response.json();
+}
+"""
+
+# Runs several fetch_json requests concurrently in the page. A failed request
+# comes back as null so the caller can fall back to a regular fetch for it.
+FETCH_JSON_BATCH_SCRIPT = """
+async ({ tasks }) => {
+  const fetchJson = """ + FETCH_JSON_SCRIPT.strip() + """;
+  return Promise.all(tasks.map((task) => fetchJson(task).catch(() => null)));
+}
+"""
+
+# Runs the free-text search and, when it yields exactly one exact person match
+# with active relations, fetches that person's detail in the same round trip.
+# The name normalisation and deltager preference mirror normalise_name and
+# dedupe_person_entries; a mismatch only costs a regular detail fetch later.
+SEARCH_WITH_DETAIL_SCRIPT = """
+async ({ payload }) => {
+  const searchResponse = await fetch("/gateway/soeg/fritekst", {
+    method: "POST",
+    headers: { "content-type": "application/json" },
+    body: JSON.stringify(payload),
+  });
+  if (!searchResponse.ok) {
+    throw new Error(`${searchResponse.status} ${searchResponse.statusText}`);
+  }
+  const results = await searchResponse.json();
+
+  const normalise = (value) => (value || "").normalize("NFKC").trim().toLowerCase().replace(/\\s+/g, " ");
+  const expected = normalise(payload.fritekstCommand.soegOrd);
+  const matches = new Map();
+  let unkeyed = 0;
+  for (const entry of results.enheder || []) {
+    if (entry.enhedstype !== "person" || normalise(entry.senesteNavn) !== expected) {
+      continue;
+    }
+    const key = String(entry.enhedsnummer || "");
+    if (!key) {
+      unkeyed += 1;
+      continue;
+    }
+    const existing = matches.get(key);
+    if (!existing || (existing.personType !== "deltager" && entry.personType === "deltager")) {
+      matches.set(key, entry);
+    }
+  }
+
+  if (unkeyed || matches.size !== 1) {
+    return { results, detail: null };
+  }
+  const [match] = matches.values();
+  if (!match.harAktiveRelationer) {
+    return { results, detail: null };
+  }
+
+  const enhedsnummer = String(match.enhedsnummer);
+  const personType = String(match.personType || "deltager");
+  try {
+    const detailResponse = await fetch(
+      `/gateway/person/hentPerson?enhedsnummer=${enhedsnummer}&persontype=${personType}&locale=da`,
+    );
+    if (!detailResponse.ok) {
+      return { results, detail: null };
+    }
+    return { results, detail: { enhedsnummer, personType, data: await detailResponse.json() } };
+  } catch (error) {
+    return { results, detail: null };
+  }
+}
+"""
+
+# Runs several searches from the page in one evaluate, one after another and
+# delayMs apart. A failed search comes back as null and is retried by the
+# regular fetch_search_results path; a 429 stops the rest of the batch.
+BATCH_SEARCH_WITH_DETAIL_SCRIPT = """
+async ({ payloads, delayMs }) => {
+  const searchWithDetail = """ + SEARCH_WITH_DETAIL_SCRIPT.strip() + """;
+  const results = [];
+  for (const [index, payload] of payloads.entries()) {
+    if (index) {
+      await new Promise((resolve) => setTimeout(resolve, delayMs));
+    }
+    try {
+      results.push(await searchWithDetail({ payload }));
+    } catch (error) {
+      results.push(null);
+      if (String(error.message).startsWith("429")) {
+        return { results, rateLimited: true };
+      }
+    }
+  }
+  return { results, rateLimited: false };
+}
+"""
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--output", default=str(OUTPUT_FILE), help="Output JSON path.")
-    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY, help="Delay between lookups in seconds.")
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=DEFAULT_DELAY,
+        help="Delay between lookups in seconds, shared across all tabs.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Number of browser tabs used for lookups in parallel.",
+    )
     parser.add_argument("--chrome-path", default="", help="Explicit path to chrome.exe.")
     parser.add_argument("--dry-run", action="store_true", help="Fetch only the first 5 profiles.")
     parser.add_argument("--ids", default="", help="Comma-separated profile IDs to fetch.")
@@ -125,6 +305,21 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Ignore LOCAL_CVR_OVERRIDES.json even if it exists.",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Start Chrome headless (new headless mode) instead of in a window.",
+    )
+    parser.add_argument(
+        "--fresh-profile",
+        action="store_true",
+        help="Wipe the persistent Chrome profile before starting.",
+    )
+    parser.add_argument(
+        "--keep-browser",
+        action="store_true",
+        help="Leave Chrome running after the run so the next run can reuse it.",
+    )
     return parser.parse_args()
 
 
@@ -152,7 +347,7 @@ def find_chrome(explicit_path: str = "") -> str:
     raise FileNotFoundError("Could not find Chrome. Pass --chrome-path.")
 
 
-def start_chrome(chrome_path: str, user_data_dir: Path, seed_url: str) -> subprocess.Popen[Any]:
+def start_chrome(chrome_path: str, user_data_dir: Path, seed_url: str, headless: bool = False) -> subprocess.Popen[Any]:
     return subprocess.Popen(
         [
             chrome_path,
@@ -160,26 +355,83 @@ def start_chrome(chrome_path: str, user_data_dir: Path, seed_url: str) -> subpro
             f"--user-data-dir={user_data_dir}",
             "--no-first-run",
             "--no-default-browser-check",
+            *CHROME_BACKGROUND_FLAGS,
+            *(CHROME_HEADLESS_FLAGS if headless else ()),
             seed_url,
         ]
     )
 
 
+def stop_chrome(process: subprocess.Popen[Any], keep_browser: bool = False) -> None:
+    if keep_browser or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def cdp_endpoint_ready() -> bool:
+    try:
+        with urlopen(f"{CDP_URL}/json/version", timeout=1) as response:
+            return response.status == 200
+    except (HTTPError, URLError, TimeoutError, OSError):
+        return False
+
+
+def wait_for_cdp_endpoint(timeout: float = CDP_STARTUP_TIMEOUT) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cdp_endpoint_ready():
+            return
+        time.sleep(CDP_POLL_INTERVAL)
+    raise RuntimeError(f"Chrome did not expose a CDP endpoint on port {DEBUG_PORT} within {timeout:.0f}s")
+
+
+@lru_cache(maxsize=4096)
 def normalise_name(value: str) -> str:
-    normalised = unicodedata.normalize("NFKC", value or "").strip().lower()
-    normalised = re.sub(r"\s+", " ", normalised)
-    return normalised
+    normalised = value or ""
+    # ASCII text is already NFKC, and the quick check is far cheaper than a rebuild.
+    if not normalised.isascii() and not unicodedata.is_normalized("NFKC", normalised):
+        normalised = unicodedata.normalize("NFKC", normalised)
+    return WHITESPACE_PATTERN.sub(" ", normalised.strip().lower())
+
+
+def build_latin_fold_table() -> dict[int, str]:
+    table: dict[int, str] = {}
+    for codepoint in range(0x80, ord(LATIN_FOLD_LIMIT)):
+        char = chr(codepoint)
+        decomposed = unicodedata.normalize("NFKD", char)
+        folded = "".join(part for part in decomposed if not unicodedata.combining(part))
+        if folded != char:
+            table[codepoint] = folded
+    return table
 
 
+LATIN_FOLD_TABLE = build_latin_fold_table()
+
+
+def strip_diacritics(value: str) -> str:
+    if value.isascii():
+        return value
+    if max(value) < LATIN_FOLD_LIMIT:
+        return value.translate(LATIN_FOLD_TABLE)
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+@lru_cache(maxsize=4096)
 def normalise_loose(value: str) -> str:
-    normalised = unicodedata.normalize("NFKD", value or "")
-    normalised = "".join(char for char in normalised if not unicodedata.combining(char))
-    normalised = re.sub(r"[^0-9a-zA-Z\u00C0-\u017F]+", " ", normalised).strip().lower()
-    return re.sub(r"\s+", " ", normalised)
+    normalised = strip_diacritics(value or "")
+    normalised = LOOSE_SEPARATOR_PATTERN.sub(" ", normalised).strip().lower()
+    return WHITESPACE_PATTERN.sub(" ", normalised)
 
 
-def name_tokens(value: str) -> list[str]:
-    return re.findall(r"[0-9a-zA-Z\u00C0-\u017F-]+", normalise_name(value))
+@lru_cache(maxsize=4096)
+def name_tokens(value: str) -> tuple[str, ...]:
+    # Cached, so hand out an immutable tuple rather than a shared list.
+    return tuple(NAME_TOKEN_PATTERN.findall(normalise_name(value)))
 
 
 def token_components(token: str) -> list[str]:
@@ -188,13 +440,13 @@ def token_components(token: str) -> list[str]:
 
 def strip_company_prefixes(value: str) -> str:
     cleaned = value.strip(" ,.;:")
-    lowered = cleaned.lower()
-    for prefix in COMPANY_PREFIXES:
-        if lowered.startswith(prefix):
-            return cleaned[len(prefix):].strip(" ,.;:")
+    match = COMPANY_PREFIX_PATTERN.match(cleaned.lower())
+    if match:
+        return cleaned[match.end():].strip(" ,.;:")
     return cleaned
 
 
+@lru_cache(maxsize=4096)
 def normalise_company_name(value: str) -> str:
     return normalise_loose(strip_company_prefixes(value))
 
@@ -223,12 +475,11 @@ def split_compound_company_name(value: str) -> list[str]:
 def slug_status(value: str | None) -> str | None:
     if not value:
         return None
-    slug = unicodedata.normalize("NFKD", value)
-    slug = "".join(char for char in slug if not unicodedata.combining(char))
-    slug = slug.upper().replace(" ", "_").replace("-", "_")
-    return re.sub(r"[^A-Z_]", "", slug)
+    slug = strip_diacritics(value).upper().replace(" ", "_").replace("-", "_")
+    return STATUS_SLUG_STRIP_PATTERN.sub("", slug)
 
 
+@lru_cache(maxsize=256)
 def format_status(value: str | None) -> str | None:
     if not value:
         return None
@@ -249,8 +500,9 @@ def build_company_url(enhedsnummer: str) -> str:
     return f"{CVR_BASE_URL}/enhed/virksomhed/{enhedsnummer}"
 
 
+@lru_cache(maxsize=1024)
 def build_search_url(query: str) -> str:
-    return f"{CVR_BASE_URL}/soegeresultater?fritekst={quote(query)}&sideIndex=0&size=10"
+    return f"{CVR_BASE_URL}/soegeresultater?fritekst={quote(query, safe='')}&sideIndex=0&size=10"
 
 
 def build_search_payload(name: str) -> dict[str, Any]:
@@ -302,22 +554,22 @@ def strip_html_markup(value: str) -> str:
     text = value or ""
     for _ in range(2):
         text = html.unescape(text)
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = HTML_TAG_PATTERN.sub(" ", text)
     text = text.replace("\xa0", " ")
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
 
 
 def strip_nonessential_name_annotations(value: str) -> str:
     text = value or ""
-    text = re.sub(r"\s*\((?:f(?:ø|oe)dt)[^)]+\)", "", text, flags=re.IGNORECASE)
-    return re.sub(r"\s+", " ", text).strip(" ,.")
+    text = BIRTH_ANNOTATION_PATTERN.sub("", text)
+    return WHITESPACE_PATTERN.sub(" ", text).strip(" ,.")
 
 
 def extract_official_full_name(biography: str | None, fallback_name: str | None = None) -> str | None:
     if not biography:
         return fallback_name
 
-    member_data_match = re.search(r"<memberData>(.*?)</memberData>", biography, flags=re.IGNORECASE | re.DOTALL)
+    member_data_match = MEMBER_DATA_PATTERN.search(biography)
     if not member_data_match:
         return fallback_name
 
@@ -325,12 +577,7 @@ def extract_official_full_name(biography: str | None, fallback_name: str | None
     if not text:
         return fallback_name
 
-    # Do not stop on periods inside initials like "Steffen W. Frølund."
-    name_match = re.match(
-        r"^(.*?)(?:(?:,\s*|\s+)f(?:ø|oe)dt\b|(?:,\s*|\s+)bosiddende\b|(?:,\s*|\s+)datter af\b|(?:,\s*|\s+)søn af\b|(?:,\s*|\s+)son af\b|;|$)",
-        text,
-        flags=re.IGNORECASE,
-    )
+    name_match = OFFICIAL_NAME_PATTERN.match(text)
     if not name_match:
         return fallback_name
 
@@ -396,7 +643,7 @@ def load_hverv_index() -> dict[str, Any]:
     if not HVERV_FILE.exists():
         return {}
     try:
-        payload = json.loads(HVERV_FILE.read_text(encoding="utf-8"))
+        payload = read_json(HVERV_FILE)
     except Exception:  # noqa: BLE001
         return {}
     return payload.get("medlemmer", {})
@@ -406,7 +653,7 @@ def load_override_file(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = read_json(path)
     except Exception:  # noqa: BLE001
         return {}
     if isinstance(payload, dict) and "medlemmer" in payload and isinstance(payload["medlemmer"], dict):
@@ -426,13 +673,14 @@ def extract_hverv_clues(hverv_entry: dict[str, Any] | None) -> dict[str, list[st
     company_cvrs: list[str] = []
     if not hverv_entry:
         return {"company_names": company_names, "company_cvrs": company_cvrs}
+    seen_names: set[str] = set()
+    seen_cvrs: set[str] = set()
 
     for registration in hverv_entry.get("registreringer") or []:
         description = registration.get("beskrivelse") or ""
+        # The capture group is \d{6,8}, so every match is already bare digits.
         for match in CVR_NUMBER_PATTERN.findall(description):
-            digits = re.sub(r"\D", "", match)
-            if digits and digits not in company_cvrs:
-                company_cvrs.append(digits)
+            add_unique(company_cvrs, seen_cvrs, match)
 
         raw_names: list[str] = []
         raw_names.extend(FOUNDATION_NAME_PATTERN.findall(description))
@@ -445,9 +693,8 @@ def extract_hverv_clues(hverv_entry: dict[str, Any] | None) -> dict[str, list[st
 
         for match in expanded_names:
             candidate = normalise_company_name(match)
-            if len(candidate) < 4 or candidate in company_names:
-                continue
-            company_names.append(candidate)
+            if len(candidate) >= 4:
+                add_unique(company_names, seen_names, candidate)
 
     company_names = [
         name
@@ -459,23 +706,9 @@ def extract_hverv_clues(hverv_entry: dict[str, Any] | None) -> dict[str, list[st
 
 def fetch_json(page: Any, path: str, method: str = "GET", payload: Any = None, retries: int = 3) -> Any:
     last_error: Exception | None = None
-    script = """
-async ({ path, method, payload }) => {
-  const options = { method, headers: {} };
-  if (payload !== null) {
-    options.headers["content-type"] = "application/json";
-    options.body = JSON.stringify(payload);
-  }
-  const response = await fetch(path, options);
-  if (!response.ok) {
-    throw new Error(`${response.status} ${response.statusText}`);
-  }
-  return await response.json();
-}
-"""
     for attempt in range(1, retries + 1):
         try:
-            return page.evaluate(script, {"path": path, "method": method, "payload": payload})
+            return page.evaluate(FETCH_JSON_SCRIPT, {"path": path, "method": method, "payload": payload})
         except Exception as exc:  # noqa: BLE001
             last_error = exc
             if attempt == retries:
@@ -484,7 +717,63 @@ async ({ path, method, payload }) => {
     raise RuntimeError(f"Failed to fetch {path}: {last_error}") from last_error
 
 
-def fetch_search_results(page: Any, query: str) -> dict[str, Any]:
+def store_search_with_detail(response: dict[str, Any]) -> dict[str, Any]:
+    detail = response.get("detail")
+    if detail:
+        PERSON_DETAIL_CACHE[(detail["enhedsnummer"], detail["personType"])] = detail["data"]
+    return response["results"]
+
+
+def fetch_search_with_detail(page: Any, payload: dict[str, Any]) -> dict[str, Any]:
+    return store_search_with_detail(page.evaluate(SEARCH_WITH_DETAIL_SCRIPT, {"payload": payload}))
+
+
+def back_off_searches(seconds: float) -> None:
+    global search_backoff_until
+    with SEARCH_BACKOFF_LOCK:
+        search_backoff_until = max(search_backoff_until, time.monotonic() + seconds)
+
+
+def wait_for_search_backoff() -> None:
+    remaining = search_backoff_until - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def prefetch_search_results(page: Any, queries: list[str]) -> None:
+    pending: dict[str, str] = {}
+    for query in queries:
+        cache_key = normalise_name(query)
+        if cache_key not in SEARCH_CACHE:
+            pending.setdefault(cache_key, query)
+    if not pending:
+        return
+
+    payloads = [build_search_payload(query) for query in pending.values()]
+    wait_for_search_backoff()
+    with SEARCH_SLOTS:
+        time.sleep(CVR_SEARCH_DELAY)
+        batch = page.evaluate(
+            BATCH_SEARCH_WITH_DETAIL_SCRIPT,
+            {"payloads": payloads, "delayMs": int(CVR_SEARCH_DELAY * 1000)},
+        )
+    if batch["rateLimited"]:
+        back_off_searches(CVR_RATE_LIMIT_SLEEP)
+    for cache_key, response in zip(pending, batch["results"]):
+        if response is not None:
+            SEARCH_CACHE[cache_key] = store_search_with_detail(response)
+
+
+def fetch_json_batch(page: Any, tasks: list[dict[str, Any]]) -> list[Any]:
+    if not tasks:
+        return []
+    return page.evaluate(
+        FETCH_JSON_BATCH_SCRIPT,
+        {"tasks": [{"method": "GET", "payload": None, **task} for task in tasks]},
+    )
+
+
+def fetch_search_results(page: Any, query: str, prefetch_detail: bool = False) -> dict[str, Any]:
     cache_key = normalise_name(query)
     if cache_key in SEARCH_CACHE:
         return SEARCH_CACHE[cache_key]
@@ -493,8 +782,13 @@ def fetch_search_results(page: Any, query: str) -> dict[str, Any]:
     payload = build_search_payload(query)
     for attempt in range(1, CVR_SEARCH_MAX_RETRIES + 1):
         try:
-            time.sleep(CVR_SEARCH_DELAY)
-            results = fetch_json(page, "/gateway/soeg/fritekst", method="POST", payload=payload, retries=1)
+            wait_for_search_backoff()
+            with SEARCH_SLOTS:
+                time.sleep(CVR_SEARCH_DELAY)
+                if prefetch_detail:
+                    results = fetch_search_with_detail(page, payload)
+                else:
+                    results = fetch_json(page, "/gateway/soeg/fritekst", method="POST", payload=payload, retries=1)
             SEARCH_CACHE[cache_key] = results
             return results
         except Exception as exc:  # noqa: BLE001
@@ -502,18 +796,31 @@ def fetch_search_results(page: Any, query: str) -> dict[str, Any]:
             if attempt == CVR_SEARCH_MAX_RETRIES:
                 break
 
-            backoff = CVR_RATE_LIMIT_SLEEP * attempt if "429" in str(exc) else float(attempt)
-            time.sleep(backoff)
+            if "429" in str(exc):
+                back_off_searches(CVR_RATE_LIMIT_SLEEP * attempt)
+            else:
+                time.sleep(float(attempt))
 
     raise RuntimeError(f"Failed to search Virk for {query!r}: {last_error}") from last_error
 
 
 def build_text_lookup(text_rows: list[dict[str, Any]]) -> dict[str, str]:
-    lookup: dict[str, str] = {}
-    for row in text_rows:
-        if row.get("locale") == "da" and row.get("type") == "Text" and row.get("code") and row.get("message"):
-            lookup[row["code"]] = row["message"]
-    return lookup
+    # Locale rejects most rows, so test it first.
+    return {
+        row["code"]: row["message"]
+        for row in text_rows
+        if row.get("locale") == "da" and row.get("type") == "Text" and row.get("code") and row.get("message")
+    }
+
+
+def load_cached_text_lookup() -> dict[str, str] | None:
+    # Virk's label dictionary rarely changes, so a day-old copy is good enough.
+    try:
+        if time.time() - TEXT_CACHE_FILE.stat().st_mtime > TEXT_CACHE_MAX_AGE:
+            return None
+        return read_json(TEXT_CACHE_FILE)
+    except Exception:  # noqa: BLE001
+        return None
 
 
 def translate_role(code: str | None, text_lookup: dict[str, str]) -> str:
@@ -533,66 +840,79 @@ def humanise_code(code: str) -> str:
     return label[:1].upper() + label[1:] if label else code
 
 
-def add_unique(values: list[str], value: str | None) -> None:
-    if value and value not in values:
+def add_unique(values: list[str], seen: set[str], value: str | None) -> None:
+    if value and value not in seen:
+        seen.add(value)
         values.append(value)
 
 
-def add_fact(facts: list[dict[str, str]], label: str, value: str) -> None:
-    for fact in facts:
-        if fact["label"] == label and fact["value"] == value:
-            return
+def add_fact(facts: list[dict[str, str]], seen: set[tuple[str, str]], label: str, value: str) -> None:
+    key = (label, value)
+    if key in seen:
+        return
+    seen.add(key)
     facts.append({"label": label, "value": value})
 
 
 def merge_relations(relations: list[dict[str, Any]], text_lookup: dict[str, str]) -> list[dict[str, Any]]:
     grouped: dict[str, dict[str, Any]] = {}
+    seen_roles: dict[str, set[str]] = {}
+    seen_facts: dict[str, set[tuple[str, str]]] = {}
 
     for relation in relations:
-        key = relation.get("enhedsNummer") or relation.get("cvrnummer") or relation.get("senesteNavn") or "ukendt"
-        entry = grouped.setdefault(
-            key,
-            {
-                "company_name": relation.get("senesteNavn") or "Ukendt virksomhed",
-                "company_enhedsnummer": relation.get("enhedsNummer"),
-                "company_cvr": relation.get("cvrnummer") or "",
-                "company_url": build_company_url(relation.get("enhedsNummer")) if relation.get("enhedsNummer") else "",
+        company_enhedsnummer = relation.get("enhedsNummer")
+        company_cvr = relation.get("cvrnummer")
+        company_name = relation.get("senesteNavn")
+        key = company_enhedsnummer or company_cvr or company_name or "ukendt"
+
+        entry = grouped.get(key)
+        if entry is None:
+            entry = grouped[key] = {
+                "company_name": company_name or "Ukendt virksomhed",
+                "company_enhedsnummer": company_enhedsnummer,
+                "company_cvr": company_cvr or "",
+                "company_url": build_company_url(company_enhedsnummer) if company_enhedsnummer else "",
                 "status": format_status(relation.get("virksomhedsstatus")),
                 "roles": [],
                 "facts": [],
-            },
-        )
+            }
+            seen_roles[key] = set()
+            seen_facts[key] = set()
 
-        add_unique(entry["roles"], translate_role(relation.get("tekstnogle"), text_lookup))
+        add_unique(entry["roles"], seen_roles[key], translate_role(relation.get("tekstnogle"), text_lookup))
 
+        fact_keys = seen_facts[key]
         for fact in relation.get("ekstraDataList") or []:
             label = translate_extra_label(fact.get("tekstnogle"), text_lookup)
             value = str(fact.get("vaerdi") or "").strip()
             if value:
-                add_fact(entry["facts"], label, value)
+                add_fact(entry["facts"], fact_keys, label, value)
 
     return sorted(grouped.values(), key=lambda item: normalise_name(item["company_name"]))
 
 
-def dedupe_person_entries(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    deduped: dict[str, dict[str, Any]] = {}
+def dedupe_person_entries(entries: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Entries without an enhedsnummer are kept as-is, in their original position.
+    deduped: list[dict[str, Any]] = []
+    positions: dict[str, int] = {}
     for entry in entries:
         key = str(entry.get("enhedsnummer") or "")
         if not key:
-            deduped[f"__index_{len(deduped)}"] = entry
+            deduped.append(entry)
             continue
 
-        existing = deduped.get(key)
-        if not existing:
-            deduped[key] = entry
+        position = positions.get(key)
+        if position is None:
+            positions[key] = len(deduped)
+            deduped.append(entry)
             continue
 
-        existing_type = str(existing.get("personType") or "")
+        existing_type = str(deduped[position].get("personType") or "")
         current_type = str(entry.get("personType") or "")
         if existing_type != "deltager" and current_type == "deltager":
-            deduped[key] = entry
+            deduped[position] = entry
 
-    return list(deduped.values())
+    return deduped
 
 
 def dedupe_company_entries(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -753,68 +1073,92 @@ def attach_verified_companies(
     return entry
 
 
-def find_exact_person_matches(results: dict[str, Any], name: str) -> list[dict[str, Any]]:
-    expected = normalise_name(name)
-    return dedupe_person_entries([
-        entry
-        for entry in results.get("enheder") or []
-        if entry.get("enhedstype") == "person" and normalise_name(entry.get("senesteNavn", "")) == expected
-    ])
+def search_result_persons(results: dict[str, Any]) -> list[dict[str, Any]]:
+    return [entry for entry in results.get("enheder") or [] if entry.get("enhedstype") == "person"]
+
+
+def classify_person_matches(
+    persons: list[dict[str, Any]],
+    expected: str,
+    expected_tokens: tuple[str, ...],
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+    # One walk over the persons yields both the exact matches and the lone
+    # extended-name candidate, instead of two separate filter passes.
+    exact_matches: list[dict[str, Any]] = []
+    for entry in persons:
+        candidate_name = entry.get("senesteNavn")
+        if candidate_name and normalise_name(candidate_name) == expected:
+            exact_matches.append(entry)
 
+    extended_match = None
+    if len(persons) == 1 and is_extended_name_match(name_tokens(persons[0].get("senesteNavn", "")), expected_tokens):
+        extended_match = persons[0]
+    return dedupe_person_entries(exact_matches), extended_match
 
-def find_variant_person_matches(results: dict[str, Any], name: str) -> list[dict[str, Any]]:
-    expected_tokens = name_tokens(name)
+
+def find_variant_person_matches(persons: list[dict[str, Any]], expected_tokens: tuple[str, ...]) -> list[dict[str, Any]]:
     if len(expected_tokens) < 2:
         return []
 
-    expected_first = expected_tokens[0]
-    expected_last = expected_tokens[-1]
-    matches: list[dict[str, Any]] = []
-
-    for entry in results.get("enheder") or []:
-        if entry.get("enhedstype") != "person":
-            continue
-        candidate_tokens = name_tokens(entry.get("senesteNavn", ""))
-        if len(candidate_tokens) < 2 or candidate_tokens[0] != expected_first:
-            continue
+    # Filter and dedupe in the same walk over the persons.
+    return dedupe_person_entries(
+        entry
+        for entry in persons
+        if is_variant_name_match(name_tokens(entry.get("senesteNavn", "")), expected_tokens)
+    )
 
-        candidate_tail = candidate_tokens[1:]
-        last_token_matches = any(
-            expected_last == token or expected_last in token_components(token)
-            for token in candidate_tail
-        )
-        if not last_token_matches:
-            continue
-        matches.append(entry)
 
-    return dedupe_person_entries(matches)
+def is_variant_name_match(candidate_tokens: tuple[str, ...], expected_tokens: tuple[str, ...]) -> bool:
+    if len(candidate_tokens) < 2 or candidate_tokens[0] != expected_tokens[0]:
+        return False
 
+    expected_last = expected_tokens[-1]
+    return any(
+        expected_last == token or expected_last in token_components(token)
+        for token in candidate_tokens[1:]
+    )
 
-def find_single_extended_name_match(results: dict[str, Any], name: str) -> dict[str, Any] | None:
-    person_candidates = [entry for entry in results.get("enheder") or [] if entry.get("enhedstype") == "person"]
-    if len(person_candidates) != 1:
-        return None
 
-    candidate = person_candidates[0]
-    expected_tokens = name_tokens(name)
-    candidate_tokens = name_tokens(candidate.get("senesteNavn", ""))
+def is_extended_name_match(candidate_tokens: tuple[str, ...], expected_tokens: tuple[str, ...]) -> bool:
     if len(expected_tokens) < 2 or len(candidate_tokens) < len(expected_tokens):
-        return None
+        return False
     if expected_tokens[0] != candidate_tokens[0] or expected_tokens[-1] != candidate_tokens[-1]:
-        return None
+        return False
 
     index = 0
     for token in candidate_tokens:
         if index < len(expected_tokens) and token == expected_tokens[index]:
             index += 1
-    return candidate if index == len(expected_tokens) else None
+    return index == len(expected_tokens)
+
+
+def candidate_person_key(candidate: dict[str, Any]) -> tuple[str, str]:
+    person_enhedsnummer = str(candidate.get("enhedsnummer") or candidate.get("person_enhedsnummer") or "")
+    person_type = str(candidate.get("personType") or candidate.get("person_type") or "deltager")
+    return person_enhedsnummer, person_type
+
+
+def person_detail_path(person_enhedsnummer: str, person_type: str) -> str:
+    return f"/gateway/person/hentPerson?enhedsnummer={person_enhedsnummer}&persontype={person_type}&locale=da"
 
 
 def fetch_person_detail(page: Any, person_enhedsnummer: str, person_type: str) -> dict[str, Any]:
-    return fetch_json(
-        page,
-        f"/gateway/person/hentPerson?enhedsnummer={person_enhedsnummer}&persontype={person_type}&locale=da",
-    )
+    prefetched = PERSON_DETAIL_CACHE.pop((person_enhedsnummer, person_type), None)
+    if prefetched is not None:
+        return prefetched
+    return fetch_json(page, person_detail_path(person_enhedsnummer, person_type))
+
+
+def prefetch_person_details(page: Any, candidates: list[dict[str, Any]]) -> None:
+    keys = [
+        key
+        for key in dict.fromkeys(candidate_person_key(candidate) for candidate in candidates)
+        if key[0] and key not in PERSON_DETAIL_CACHE
+    ]
+    details = fetch_json_batch(page, [{"path": person_detail_path(*key)} for key in keys])
+    for key, detail in zip(keys, details):
+        if detail is not None:
+            PERSON_DETAIL_CACHE[key] = detail
 
 
 def build_match_entry(
@@ -828,8 +1172,7 @@ def build_match_entry(
     official_name: str | None = None,
     force_detail: bool = False,
 ) -> dict[str, Any]:
-    person_enhedsnummer = str(candidate.get("enhedsnummer") or candidate.get("person_enhedsnummer") or "")
-    person_type = str(candidate.get("personType") or candidate.get("person_type") or "deltager")
+    person_enhedsnummer, person_type = candidate_person_key(candidate)
     person_name = candidate.get("senesteNavn") or candidate.get("person_name") or candidate.get("name") or profile["name"]
     has_active_relations = bool(candidate.get("harAktiveRelationer") or candidate.get("has_active_relations"))
     person_url = build_person_url(person_enhedsnummer, person_type)
@@ -871,25 +1214,17 @@ def build_match_entry(
 
 
 def score_candidate_against_clues(entry: dict[str, Any], clues: dict[str, list[str]]) -> dict[str, Any]:
-    relation_names = [normalise_company_name(relation.get("company_name") or "") for relation in entry.get("active_relations") or []]
-    relation_cvrs = {str(relation.get("company_cvr") or "") for relation in entry.get("active_relations") or [] if relation.get("company_cvr")}
-    matched_cvrs = sorted({cvr for cvr in clues["company_cvrs"] if cvr in relation_cvrs})
-    matched_names: list[str] = []
-
-    for clue in clues["company_names"]:
-        if len(clue) < 4:
-            continue
-        for relation_name in relation_names:
-            if not relation_name:
-                continue
-            if relation_name == clue:
-                matched_names.append(clue)
-                break
+    active_relations = entry.get("active_relations") or []
+    relation_names = {normalise_company_name(relation.get("company_name") or "") for relation in active_relations}
+    relation_cvrs = {str(relation.get("company_cvr") or "") for relation in active_relations if relation.get("company_cvr")}
+    matched_cvrs = sorted(relation_cvrs.intersection(clues["company_cvrs"]))
+    # extract_hverv_clues already drops names shorter than four characters.
+    matched_names = relation_names.intersection(clues["company_names"])
 
     return {
         "score": (len(matched_cvrs) * 100) + (len(matched_names) * 30),
         "matched_cvrs": matched_cvrs,
-        "matched_names": sorted(set(matched_names)),
+        "matched_names": sorted(matched_names),
     }
 
 
@@ -906,6 +1241,15 @@ def choose_verified_candidate(
     if not clues["company_names"] and not clues["company_cvrs"]:
         return None
 
+    # Every candidate needs its detail for scoring, including those the search
+    # index flags as inactive (that flag is not trusted); fetch them all in
+    # one round trip.
+    if len(candidates) > 1:
+        try:
+            prefetch_person_details(page, candidates)
+        except Exception:  # noqa: BLE001
+            pass
+
     scored_candidates: list[tuple[dict[str, Any], dict[str, Any], dict[str, Any]]] = []
     for candidate in candidates:
         entry = build_match_entry(
@@ -951,6 +1295,20 @@ def choose_verified_candidate(
     return best_entry
 
 
+def summarise_person_candidate(entry: dict[str, Any], include_activity: bool = False) -> dict[str, Any]:
+    person_enhedsnummer = entry.get("enhedsnummer") or ""
+    person_type = entry.get("personType") or ""
+    candidate: dict[str, Any] = {
+        "name": entry.get("senesteNavn") or "",
+        "person_enhedsnummer": person_enhedsnummer,
+        "person_type": person_type,
+    }
+    if include_activity:
+        candidate["has_active_relations"] = bool(entry.get("harAktiveRelationer"))
+    candidate["person_url"] = build_person_url(person_enhedsnummer, person_type) if person_enhedsnummer and person_type else ""
+    return candidate
+
+
 def build_no_match_entry(
     profile: dict[str, Any],
     results: dict[str, Any],
@@ -958,20 +1316,10 @@ def build_no_match_entry(
     official_name: str | None = None,
     search_names: list[str] | None = None,
 ) -> dict[str, Any]:
-    person_candidates = []
-    for person_entry in dedupe_person_entries([entry for entry in results.get("enheder") or [] if entry.get("enhedstype") == "person"]):
-        person_candidates.append(
-            {
-                "name": person_entry.get("senesteNavn") or "",
-                "person_enhedsnummer": person_entry.get("enhedsnummer") or "",
-                "person_type": person_entry.get("personType") or "",
-                "person_url": (
-                    build_person_url(person_entry.get("enhedsnummer"), person_entry.get("personType"))
-                    if person_entry.get("enhedsnummer") and person_entry.get("personType")
-                    else ""
-                ),
-            }
-        )
+    person_candidates = [
+        summarise_person_candidate(person_entry)
+        for person_entry in dedupe_person_entries(search_result_persons(results))
+    ]
     entry = {
         "id": profile["id"],
         "name": profile["name"],
@@ -1003,20 +1351,7 @@ def build_ambiguous_entry(
         "status": "ambiguous",
         "person_total": int(results.get("personTotal") or 0),
         "exact_match_count": len(matches),
-        "candidates": [
-            {
-                "name": match.get("senesteNavn") or "",
-                "person_enhedsnummer": match.get("enhedsnummer") or "",
-                "person_type": match.get("personType") or "",
-                "has_active_relations": bool(match.get("harAktiveRelationer")),
-                "person_url": (
-                    build_person_url(match.get("enhedsnummer"), match.get("personType"))
-                    if match.get("enhedsnummer") and match.get("personType")
-                    else ""
-                ),
-            }
-            for match in matches
-        ],
+        "candidates": [summarise_person_candidate(match, include_activity=True) for match in matches],
     }
     if official_name:
         entry["official_name"] = official_name
@@ -1032,14 +1367,14 @@ def fetch_profile_entry(
     page: Any,
     profile: dict[str, Any],
     text_lookup: dict[str, str],
-    hverv_index: dict[str, Any],
+    clues_by_id: dict[str, dict[str, list[str]]],
     overrides: dict[str, Any],
     official_name_map: dict[int, str],
 ) -> dict[str, Any]:
     override = overrides.get(str(profile["id"]))
     official_name = official_name_map.get(int(profile["id"]))
     search_names = build_search_names(profile, official_name_map)
-    clues = extract_hverv_clues(hverv_index.get(str(profile["id"])))
+    clues = clues_by_id.get(str(profile["id"])) or extract_hverv_clues(None)
 
     if override:
         override_candidate = {
@@ -1070,15 +1405,20 @@ def fetch_profile_entry(
         )
 
     last_results: dict[str, Any] | None = None
+    official_normalised = normalise_name(official_name) if official_name else ""
     has_distinct_official_name = bool(
-        official_name and normalise_name(official_name) != normalise_name(profile.get("name") or "")
+        official_name and official_normalised != normalise_name(profile.get("name") or "")
     )
 
     for search_name in search_names:
-        search_results = fetch_search_results(page, search_name)
+        search_results = fetch_search_results(page, search_name, prefetch_detail=True)
         last_results = search_results
+        # The person rows are shared by every matcher below.
+        persons = search_result_persons(search_results)
+        expected = normalise_name(search_name)
+        expected_tokens = name_tokens(search_name)
 
-        matches = find_exact_person_matches(search_results, search_name)
+        matches, extended_match = classify_person_matches(persons, expected, expected_tokens)
         if len(matches) == 1:
             return attach_verified_companies(
                 build_match_entry(
@@ -1121,10 +1461,9 @@ def fetch_profile_entry(
                 official_name,
             )
 
-        variant_matches = find_variant_person_matches(search_results, search_name)
-        extended_match = find_single_extended_name_match(search_results, search_name)
+        variant_matches = find_variant_person_matches(persons, expected_tokens)
         is_official_name_search = bool(
-            official_name and normalise_name(search_name) == normalise_name(official_name)
+            official_name and expected == official_normalised
         )
         allow_loose_name_matching = is_official_name_search or not has_distinct_official_name
 
@@ -1201,17 +1540,134 @@ def fetch_profile_entry(
     )
 
 
+def ensure_on_virk(page: Any) -> None:
+    # The gateway calls are relative fetch() requests, so the page has to sit
+    # on the Virk origin; a tab left on about:blank would fail every lookup.
+    if not page.url.startswith(CVR_BASE_URL):
+        try:
+            page.goto(CVR_BASE_URL, wait_until="domcontentloaded", timeout=PAGE_READY_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
+    if not page.url.startswith(CVR_BASE_URL):
+        raise RuntimeError(f"Chrome tab never reached {CVR_BASE_URL} (stuck on {page.url!r})")
+
+
+def open_worker_page(browser: Any) -> Any:
+    # A tab in the persistent profile's default context shares its Virk
+    # session cookies; a new_context() would start out empty.
+    page = browser.contexts[0].new_page()
+    ensure_on_virk(page)
+    return page
+
+
+def run_profile_worker(
+    profile_queue: queue.Queue[dict[str, Any]],
+    record_entry: Callable[[dict[str, Any], dict[str, Any]], None],
+    text_lookup: dict[str, str],
+    clues_by_id: dict[str, dict[str, list[str]]],
+    overrides: dict[str, Any],
+    official_name_map: dict[int, str],
+    batch_size: int,
+    delay: float,
+    start_delay: float = 0.0,
+) -> None:
+    # Playwright's sync API is bound to the thread that started it, so every
+    # worker opens its own CDP connection and its own tab.
+    if start_delay > 0:
+        time.sleep(start_delay)
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.connect_over_cdp(CDP_URL)
+        page = open_worker_page(browser)
+        while True:
+            batch: list[dict[str, Any]] = []
+            while len(batch) < batch_size:
+                try:
+                    batch.append(profile_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                break
+
+            # Warm the search cache with each profile's first search name in a
+            # single evaluate; fetch_profile_entry then hits the cache.
+            first_search_names: list[str] = []
+            for profile in batch:
+                if str(profile["id"]) in overrides:
+                    continue
+                search_names = build_search_names(profile, official_name_map)
+                if search_names:
+                    first_search_names.append(search_names[0])
+            try:
+                prefetch_search_results(page, first_search_names)
+            except Exception:  # noqa: BLE001
+                pass
+
+            for profile in batch:
+                try:
+                    entry = fetch_profile_entry(page, profile, text_lookup, clues_by_id, overrides, official_name_map)
+                except Exception as exc:  # noqa: BLE001
+                    entry = {
+                        "id": profile["id"],
+                        "name": profile["name"],
+                        "status": "error",
+                        "error": str(exc),
+                    }
+
+                record_entry(profile, entry)
+                if delay > 0:
+                    time.sleep(delay)
+        page.close()
+        browser.close()
+
+
 def write_json(path: Path, payload: Any) -> None:
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def read_json(path: Path) -> Any:
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def encode_json_line(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def progress_path_for(output_path: Path) -> Path:
+    return output_path.with_name(f"{output_path.stem}.progress.jsonl")
+
+
+def load_progress(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+
+    entries: dict[str, Any] = {}
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # A run that was killed mid-write leaves a truncated last line.
+                continue
+            entries[str(row["id"])] = row["entry"]
+    return entries
 
 
 def load_profiles(args: argparse.Namespace) -> list[dict[str, Any]]:
-    profiles = json.loads(PROFILES_FILE.read_text(encoding="utf-8"))
+    profiles = read_json(PROFILES_FILE)
     selected_ids = parse_selected_ids(args.ids)
     if selected_ids:
         profiles = [profile for profile in profiles if int(profile["id"]) in selected_ids]
     if args.retry_errors and Path(args.output).exists():
-        existing = json.loads(Path(args.output).read_text(encoding="utf-8")).get("medlemmer", {})
+        existing = read_json(Path(args.output)).get("medlemmer", {})
         retry_ids = {key for key, value in existing.items() if value.get("status") == "error"}
         profiles = [profile for profile in profiles if str(profile["id"]) in retry_ids]
     if args.dry_run:
@@ -1223,7 +1679,7 @@ def load_existing_output(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return read_json(path)
     except Exception:  # noqa: BLE001
         return {}
 
@@ -1231,20 +1687,27 @@ def load_existing_output(path: Path) -> dict[str, Any]:
 def main() -> None:
     args = parse_args()
     output_path = Path(args.output)
+    progress_path = progress_path_for(output_path)
     profiles = load_profiles(args)
     existing_output = load_existing_output(output_path)
     hverv_index = load_hverv_index()
+    clues_by_id = {
+        str(profile["id"]): extract_hverv_clues(hverv_index.get(str(profile["id"])))
+        for profile in profiles
+    }
     overrides = load_overrides(include_local=not args.no_local_overrides)
     official_name_map = load_official_name_map({int(profile["id"]) for profile in profiles})
 
-    chrome_path = find_chrome(args.chrome_path)
     user_data_dir = (ROOT / "tmp_chrome_cvr_profile").resolve()
-    if user_data_dir.exists():
-        shutil.rmtree(user_data_dir, ignore_errors=True)
-    user_data_dir.mkdir(parents=True, exist_ok=True)
-
-    seed_url = CVR_BASE_URL
-    process = start_chrome(chrome_path, user_data_dir, seed_url)
+    if cdp_endpoint_ready():
+        print(f"Reusing Chrome already listening on port {DEBUG_PORT}")
+    else:
+        chrome_path = find_chrome(args.chrome_path)
+        if args.fresh_profile and user_data_dir.exists():
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+        user_data_dir.mkdir(parents=True, exist_ok=True)
+        process = start_chrome(chrome_path, user_data_dir, CVR_BASE_URL, headless=args.headless)
+        atexit.register(stop_chrome, process, args.keep_browser)
 
     output: dict[str, Any] = {
         "generated": str(date.today()),
@@ -1256,50 +1719,84 @@ def main() -> None:
         ),
         "medlemmer": dict(existing_output.get("medlemmer", {})),
     }
+    output["medlemmer"].update(load_progress(progress_path))
 
-    try:
-        time.sleep(8)
+    wait_for_cdp_endpoint()
+    text_lookup = load_cached_text_lookup()
+    if text_lookup is None:
         with sync_playwright() as playwright:
-            browser = playwright.chromium.connect_over_cdp(f"http://127.0.0.1:{DEBUG_PORT}")
+            browser = playwright.chromium.connect_over_cdp(CDP_URL)
             context = browser.contexts[0]
             page = context.pages[0] if context.pages else context.new_page()
             try:
-                page.wait_for_load_state("networkidle", timeout=60000)
+                page.wait_for_load_state("domcontentloaded", timeout=PAGE_READY_TIMEOUT_MS)
             except PlaywrightTimeoutError:
                 pass
+            ensure_on_virk(page)
 
-            text_rows = fetch_json(page, "/gateway/tekst")
-            text_lookup = build_text_lookup(text_rows)
-
-            total = len(profiles)
-            for index, profile in enumerate(profiles, start=1):
-                try:
-                    entry = fetch_profile_entry(page, profile, text_lookup, hverv_index, overrides, official_name_map)
-                except Exception as exc:  # noqa: BLE001
-                    entry = {
-                        "id": profile["id"],
-                        "name": profile["name"],
-                        "status": "error",
-                        "error": str(exc),
-                    }
-
-                output["medlemmer"][str(profile["id"])] = entry
-                write_json(output_path, output)
-
-                status = entry.get("status")
-                active_count = len(entry.get("active_relations") or [])
-                print(f"[{index}/{total}] {profile['name']} -> {status} ({active_count} aktive relationer)")
-                if index < total and args.delay > 0:
-                    time.sleep(args.delay)
-
+            text_lookup = build_text_lookup(fetch_json(page, "/gateway/tekst"))
             browser.close()
+        write_json(TEXT_CACHE_FILE, text_lookup)
+
+    total = len(profiles)
+    completed = 0
+    write_lock = threading.Lock()
+    progress = progress_path.open("ab")
+
+    def record_entry(profile: dict[str, Any], entry: dict[str, Any]) -> None:
+        nonlocal completed
+        with write_lock:
+            output["medlemmer"][str(profile["id"])] = entry
+            progress.write(encode_json_line({"id": str(profile["id"]), "entry": entry}))
+            progress.flush()
+            completed += 1
+
+            status = entry.get("status")
+            active_count = len(entry.get("active_relations") or [])
+            print(f"[{completed}/{total}] {profile['name']} -> {status} ({active_count} aktive relationer)")
+
+    profile_queue: queue.Queue[dict[str, Any]] = queue.Queue()
+    for profile in profiles:
+        profile_queue.put(profile)
+
+    worker_count = max(1, min(args.concurrency, total))
+    # Never let one worker grab more than its share, or the first one to start
+    # takes every profile on a small run.
+    batch_size = max(1, min(SEARCH_BATCH_SIZE, total // worker_count))
+    try:
+        with progress, ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(
+                    run_profile_worker,
+                    profile_queue,
+                    record_entry,
+                    text_lookup,
+                    clues_by_id,
+                    overrides,
+                    official_name_map,
+                    batch_size,
+                    # Each tab waits delay × tabs, offset by delay, so Virk
+                    # still sees about one lookup per --delay overall.
+                    args.delay * worker_count,
+                    args.delay * worker_index,
+                )
+                for worker_index in range(worker_count)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Empty the queue so workers stop after their current batch.
+                try:
+                    while True:
+                        profile_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                raise
     finally:
-        process.terminate()
-        try:
-            process.wait(timeout=10)
-        except Exception:  # noqa: BLE001
-            process.kill()
-        shutil.rmtree(user_data_dir, ignore_errors=True)
+        # Consolidate whatever finished, also after a crash or Ctrl+C.
+        write_json(output_path, output)
+        progress_path.unlink(missing_ok=True)
 
     print(f"Skrev {output_path}")
 
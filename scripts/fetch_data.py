@@ -4,24 +4,37 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
 import html
+import http.client
 import json
+import os
 import re
+import shutil
 import sys
+import threading
 import time
 import unicodedata
 import xml.etree.ElementTree as ET
+import zlib
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.parse import quote
+from typing import Any, Callable, Iterator
+from urllib.error import HTTPError
+from urllib.parse import quote, urlsplit
 from urllib.request import Request, urlopen
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the refresh workflow runs on the stdlib alone.
+    orjson = None
+
 
 BASE_URL = "https://oda.ft.dk/api"
 PAGE_SIZE = 100
@@ -31,7 +44,18 @@ DEFAULT_RECENT_VOTES = 10
 DEFAULT_INCREMENTAL_BUFFER_DAYS = 45
 REQUEST_TIMEOUT = 60
 MAX_RETRIES = 3
+# IIS rejects query strings over 2048 characters; leave room for the paging
+# parameters next to an encoded $filter.
+ODA_FILTER_BUDGET = 1800
+# Type and status tables (Stemmetype, Sagstype, ...) change a few times a year.
+LOOKUP_CACHE_MAX_AGE = 12 * 60 * 60
+ODA_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "folkevalget-data-fetcher/1.0",
+}
 PHOTO_CREDITS_FILENAME = "credits.json"
+LOCAL_PHOTO_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".gif")
 TIMELINE_SHARD_COUNT = 32
 VOTE_DETAIL_SHARD_COUNT = 32
 
@@ -50,6 +74,11 @@ DA_MONTHS = {
     "december": 12,
 }
 
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+QUERY_SAFE_CHARS = "(),'/:$"
+QUERY_SAFE_VALUE_PATTERN = re.compile(r"[A-Za-z0-9_.~(),'/:$-]*")
+NAME_TEXT_SEPARATOR_PATTERN = re.compile(r"[^a-z0-9]+")
+
 WIKIDATA_HEADERS = {
     "User-Agent": "folkevalget-data-fetcher/1.0 (https://folkevalget.dk)",
     "Accept": "application/json",
@@ -85,6 +114,12 @@ WIKIDATA_NEGATIVE_DESC_KEYWORDS = (
     "cyclist",
     "disambiguation",
 )
+# One alternation per keyword list, so each description is scanned once.
+WIKIDATA_POSITIVE_DESC_PATTERN = re.compile("|".join(map(re.escape, WIKIDATA_POSITIVE_DESC_KEYWORDS)))
+WIKIDATA_POSITIVE_NATIONALITY_PATTERN = re.compile(
+    "|".join(map(re.escape, WIKIDATA_POSITIVE_NATIONALITY_KEYWORDS))
+)
+WIKIDATA_NEGATIVE_DESC_PATTERN = re.compile("|".join(map(re.escape, WIKIDATA_NEGATIVE_DESC_KEYWORDS)))
 WIKIDATA_SEARCH_CACHE: dict[tuple[str, str], list[dict[str, Any]]] = {}
 WIKIDATA_ENTITY_CACHE: dict[str, dict[str, Any]] = {}
 
@@ -94,11 +129,16 @@ class FetchOptions:
     delay: float
     page_size: int
     verbose: bool
+    workers: int = 1
+    lookup_cache_dir: Path | None = None
 
 
 class OdaClient:
     def __init__(self, options: FetchOptions) -> None:
         self.options = options
+        # urlopen opens a fresh TCP+TLS connection for every page. Each worker
+        # thread keeps one keep-alive connection per host instead.
+        self._local = threading.local()
 
     def get_json(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         query = encode_query(params or {})
@@ -111,16 +151,8 @@ class OdaClient:
         last_error: Exception | None = None
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                request = Request(
-                    url,
-                    headers={
-                        "Accept": "application/json",
-                        "User-Agent": "folkevalget-data-fetcher/1.0",
-                    },
-                )
-                with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
-                    return json.load(response)
-            except (HTTPError, URLError, TimeoutError) as exc:
+                return parse_json_bytes(self._read_url(url))
+            except (OSError, http.client.HTTPException) as exc:  # HTTPError and URLError are OSErrors.
                 last_error = exc
                 if attempt == MAX_RETRIES:
                     break
@@ -130,6 +162,50 @@ class OdaClient:
 
         raise RuntimeError(f"failed to fetch {url}: {last_error}") from last_error
 
+    def _read_url(self, url: str) -> bytes:
+        parts = urlsplit(url)
+        if parts.scheme != "https":
+            return self._read_url_fresh(url)
+
+        connections: dict[str, http.client.HTTPSConnection] = self._local.__dict__.setdefault("connections", {})
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        connection = connections.get(parts.netloc)
+        reused = connection is not None
+        while True:
+            if connection is None:
+                connection = connections[parts.netloc] = http.client.HTTPSConnection(
+                    parts.netloc,
+                    timeout=REQUEST_TIMEOUT,
+                )
+            try:
+                connection.request("GET", target, headers=ODA_HEADERS)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                connections.pop(parts.netloc, None)
+                connection.close()
+                if not reused:
+                    raise
+                # The server may have dropped an idle keep-alive connection;
+                # retry once on a fresh one before counting it as a failure.
+                connection = None
+                reused = False
+                continue
+
+            if response.will_close:
+                connections.pop(parts.netloc, None)
+                connection.close()
+            if 300 <= response.status < 400:
+                return self._read_url_fresh(url)
+            if response.status != 200:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return decode_response_body(body, response.getheader("Content-Encoding"))
+
+    def _read_url_fresh(self, url: str) -> bytes:
+        request = Request(url, headers=ODA_HEADERS)
+        with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            return decode_response_body(response.read(), response.headers.get("Content-Encoding"))
+
     def fetch_collection(
         self,
         endpoint: str,
@@ -137,35 +213,108 @@ class OdaClient:
         params: dict[str, Any] | None = None,
         label: str | None = None,
     ) -> list[dict[str, Any]]:
-        base_params = dict(params or {})
-        items: list[dict[str, Any]] = []
-        skip = 0
-
-        while True:
-            page_params = dict(base_params)
-            page_params.update(
-                {
-                    "$format": "json",
-                    "$top": self.options.page_size,
-                    "$skip": skip,
-                }
-            )
-            payload = self.get_json(endpoint, page_params)
-            page_items = payload.get("value", [])
+        page_params = {key: value for key, value in (params or {}).items() if key != "$skip"}
+        page_params.update(
+            {
+                "$format": "json",
+                "$top": self.options.page_size,
+            }
+        )
+        # Only $skip changes between pages, so the rest of the query is encoded once.
+        page_url = f"{BASE_URL}/{endpoint}?{encode_query(page_params)}"
+        page_size = self.options.page_size
+
+        def fetch_page(skip: int) -> list[dict[str, Any]]:
+            return self.get_json_url(f"{page_url}&$skip={skip}").get("value", [])
+
+        def staggered(skips: list[int]) -> Iterator[int]:
+            for index, skip in enumerate(skips):
+                if index:
+                    time.sleep(self.options.delay)
+                yield skip
+
+        # The first page also reports the total row count, which lets the
+        # remaining pages be requested side by side instead of one by one.
+        first_page = self.get_json_url(f"{page_url}&$inlinecount=allpages&$skip=0")
+        page_items = first_page.get("value", [])
+        items: list[dict[str, Any]] = list(page_items)
+        if label and items:
+            log(self.options.verbose, f"{label}: fetched {len(items)} rows")
+        skip = page_size
+
+        total = parse_inline_count(first_page)
+        parallel_pages = not getattr(self._local, "serial_pages", False)
+        if parallel_pages and total is not None and total > skip and len(page_items) >= page_size:
+            skips = list(range(skip, total, page_size))
+            with ThreadPoolExecutor(max_workers=self.options.workers) as executor:
+                for page_items in executor.map(fetch_page, staggered(skips)):
+                    items.extend(page_items)
+                    if label:
+                        log(self.options.verbose, f"{label}: fetched {len(items)} rows")
+            skip = skips[-1] + page_size
+
+        # Walk on page by page when the count is missing, or in case rows were
+        # added after it was taken.
+        while len(page_items) >= page_size:
+            time.sleep(self.options.delay)
+            page_items = fetch_page(skip)
             if not page_items:
                 break
 
             items.extend(page_items)
             if label:
                 log(self.options.verbose, f"{label}: fetched {len(items)} rows")
+            skip += page_size
 
-            if len(page_items) < self.options.page_size:
-                break
+        return items
 
-            skip += self.options.page_size
-            time.sleep(self.options.delay)
+    def fetch_pages_serially(self) -> None:
+        # For threads that already belong to a worker pool (fetch_in_chunks):
+        # paging them out again would allow workers² requests at once.
+        self._local.serial_pages = True
 
-        return items
+    def fetch_lookup_table(self, endpoint: str, *, label: str) -> list[dict[str, Any]]:
+        cache_dir = self.options.lookup_cache_dir
+        if cache_dir is None:
+            return self.fetch_collection(endpoint, label=label)
+
+        cache_path = cache_dir / f"{label}.json"
+        try:
+            if time.time() - cache_path.stat().st_mtime <= LOOKUP_CACHE_MAX_AGE:
+                rows = parse_json_bytes(cache_path.read_bytes())
+                log(self.options.verbose, f"{label}: using cached copy ({len(rows)} rows)")
+                return rows
+        except (OSError, ValueError):
+            pass
+
+        rows = self.fetch_collection(endpoint, label=label)
+        write_json_compact(cache_path, rows)
+        return rows
+
+
+def decode_response_body(body: bytes, content_encoding: str | None) -> bytes:
+    # Neither http.client nor urlopen undo Content-Encoding on their own.
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def parse_inline_count(payload: dict[str, Any]) -> int | None:
+    # OData v3 JSON reports $inlinecount as a string under "odata.count".
+    try:
+        return int(payload["odata.count"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def parse_json_bytes(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def encode_query(params: dict[str, Any]) -> str:
@@ -173,7 +322,9 @@ def encode_query(params: dict[str, Any]) -> str:
     for key, value in params.items():
         if value is None:
             continue
-        encoded_value = quote(str(value), safe="(),'/:$")
+        text = str(value)
+        # Numbers and plain tokens ($top, $format, ...) come out of quote() unchanged.
+        encoded_value = text if QUERY_SAFE_VALUE_PATTERN.fullmatch(text) else quote(text, safe=QUERY_SAFE_CHARS)
         parts.append(f"{key}={encoded_value}")
     return "&".join(parts)
 
@@ -191,6 +342,11 @@ def parse_args() -> argparse.Namespace:
         default="data/raw",
         help="Directory for optional raw snapshots.",
     )
+    parser.add_argument(
+        "--no-lookup-cache",
+        action="store_true",
+        help="Always refetch ODA type/status tables instead of reusing a copy under raw-dir.",
+    )
     parser.add_argument(
         "--start-date",
         default=DEFAULT_START_DATE,
@@ -231,6 +387,12 @@ def parse_args() -> argparse.Namespace:
         default=6,
         help="Parallel workers for overflow vote-record pages.",
     )
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=4,
+        help="Parallel workers for id-chunked lookups (sager, dokumenter, aktører, ...).",
+    )
     parser.add_argument(
         "--write-raw",
         action="store_true",
@@ -317,14 +479,32 @@ def resolve_effective_start_date(
     return effective_start.isoformat()
 
 
+def encode_json(payload: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(payload, option=option)
+    if indent:
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def write_json(path: Path, payload: Any) -> None:
     ensure_dir(path.parent)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_bytes(encode_json(payload, indent=True))
 
 
 def write_json_compact(path: Path, payload: Any) -> None:
     ensure_dir(path.parent)
-    path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    path.write_bytes(encode_json(payload))
+
+
+def write_raw_ndjson(path: Path, rows: list[dict[str, Any]]) -> None:
+    # Raw snapshots are for debugging only; one row per line, lightly gzipped.
+    ensure_dir(path.parent)
+    with gzip.open(path, "wb", compresslevel=1) as handle:
+        for row in rows:
+            handle.write(encode_json(row))
+            handle.write(b"\n")
 
 
 def write_json_shards(directory: Path, shards: dict[str, list[dict[str, Any]]]) -> None:
@@ -369,10 +549,11 @@ def write_profile_vote_id_files(
 
 def write_javascript_payload(path: Path, variable_name: str, payload: Any) -> None:
     ensure_dir(path.parent)
-    serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-    path.write_text(f"window.{variable_name}={serialized};\n", encoding="utf-8")
+    path.write_bytes(b"window." + variable_name.encode("utf-8") + b"=" + encode_json(payload) + b";\n")
 
 
+# Relations and votes repeat a few hundred distinct dates many times over.
+@lru_cache(maxsize=4096)
 def parse_iso_date(value: str | None) -> date | None:
     if not value:
         return None
@@ -438,13 +619,18 @@ def seniority_tag_key(start_date: date | None, end_date: date) -> str | None:
     return "newcomer" if months < 48 else "experienced"
 
 
+@lru_cache(maxsize=64)
+def _tag_pattern(tag: str) -> re.Pattern[str]:
+    return re.compile(rf"<{tag}>(.*?)</{tag}>", flags=re.DOTALL)
+
+
 def extract_tag(blob: str | None, tag: str) -> str | None:
     if not blob:
         return None
-    match = re.search(rf"<{tag}>(.*?)</{tag}>", blob, flags=re.DOTALL)
+    match = _tag_pattern(tag).search(blob)
     if not match:
         return None
-    text = re.sub(r"<[^>]+>", "", match.group(1))
+    text = HTML_TAG_PATTERN.sub("", match.group(1))
     text = html.unescape(text).strip()
     return text or None
 
@@ -514,12 +700,15 @@ def normalize_photo_url(raw_url: str | None) -> str | None:
     return f"https://www.ft.dk/{raw_url.lstrip('/')}"
 
 
+@lru_cache(maxsize=4096)
 def normalize_name_text(value: str | None) -> str:
     if not value:
         return ""
-    normalized = unicodedata.normalize("NFKD", value.lower())
-    normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
+    normalized = value.lower()
+    if not normalized.isascii():
+        normalized = unicodedata.normalize("NFKD", normalized)
+        normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    normalized = NAME_TEXT_SEPARATOR_PATTERN.sub(" ", normalized)
     return " ".join(normalized.split())
 
 
@@ -546,7 +735,7 @@ def build_party_history(
 ) -> list[dict[str, Any]]:
     items: list[dict[str, Any]] = []
 
-    for membership in sorted(memberships, key=membership_sort_key, reverse=True):
+    for membership in memberships:
         actor = membership["actor"]
         start_date, end_date = effective_membership_dates(membership)
         item = {
@@ -603,12 +792,25 @@ def merge_party_history_entries(newer: dict[str, Any], older: dict[str, Any]) ->
     }
 
 
-def find_local_photo_path(person_id: int, photos_dir: Path) -> str | None:
-    for ext in (".jpg", ".jpeg", ".png", ".webp", ".gif"):
-        candidate = photos_dir / f"{person_id}{ext}"
-        if candidate.exists():
-            return f"photos/{person_id}{ext}"
-    return None
+def build_local_photo_index(photos_dir: Path) -> dict[int, str]:
+    # One directory listing instead of up to five stat calls per profile. When
+    # several extensions exist, the earliest in LOCAL_PHOTO_EXTENSIONS wins.
+    best_rank: dict[int, int] = {}
+    index: dict[int, str] = {}
+    try:
+        names = os.listdir(photos_dir)
+    except OSError:
+        return {}
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        if ext not in LOCAL_PHOTO_EXTENSIONS or not stem.isdigit() or stem != str(int(stem)):
+            continue
+        person_id = int(stem)
+        rank = LOCAL_PHOTO_EXTENSIONS.index(ext)
+        if rank < best_rank.get(person_id, len(LOCAL_PHOTO_EXTENSIONS)):
+            best_rank[person_id] = rank
+            index[person_id] = f"photos/{name}"
+    return index
 
 
 def load_photo_credit_manifest(photos_dir: Path) -> dict[int, dict[str, Any]]:
@@ -633,8 +835,9 @@ def load_photo_credit_manifest(photos_dir: Path) -> dict[int, dict[str, Any]]:
 
 def apply_local_photo_inventory(profiles: list[dict[str, Any]], photos_dir: Path) -> None:
     photo_manifest = load_photo_credit_manifest(photos_dir)
+    photo_index = build_local_photo_index(photos_dir)
     for profile in profiles:
-        local_photo_url = find_local_photo_path(profile["id"], photos_dir)
+        local_photo_url = photo_index.get(profile["id"])
         if local_photo_url:
             profile["photo_url"] = local_photo_url
 
@@ -658,12 +861,58 @@ def apply_local_photo_inventory(profiles: list[dict[str, Any]], photos_dir: Path
             profile["photo_credit_text"] = profile["photo_source_name"]
 
 
+def iter_chunks(values: list[int], size: int, delay: float) -> Iterator[list[int]]:
+    # Only pause between chunks; there is nothing to wait for after the last one.
+    for start in range(0, len(values), size):
+        if start:
+            time.sleep(delay)
+        yield values[start : start + size]
+
+
+def fetch_in_chunks(
+    client: OdaClient,
+    ids: list[int],
+    chunk_size: int,
+    fetch_chunk: Callable[[list[int]], list[dict[str, Any]]],
+    *,
+    dedupe: bool = False,
+) -> list[dict[str, Any]]:
+    # Chunks are submitted --delay apart and run on a few threads; map() keeps
+    # the results in chunk order so the output does not depend on timing.
+    rows: list[dict[str, Any]] = []
+    seen_ids: set[int] = set()
+
+    def run_chunk(chunk: list[int]) -> list[dict[str, Any]]:
+        client.fetch_pages_serially()
+        return fetch_chunk(chunk)
+
+    with ThreadPoolExecutor(max_workers=client.options.workers) as executor:
+        for chunk_rows in executor.map(run_chunk, iter_chunks(ids, chunk_size, client.options.delay)):
+            if not dedupe:
+                rows.extend(chunk_rows)
+                continue
+            for row in chunk_rows:
+                row_id = int(row["id"])
+                if row_id not in seen_ids:
+                    seen_ids.add(row_id)
+                    rows.append(row)
+    return rows
+
+
 def build_filter_for_ids(field: str, ids: list[int]) -> str:
-    return " or ".join(f"{field} eq {item}" for item in ids)
+    return " or ".join([f"{field} eq {item}" for item in ids])
+
+
+def id_filter_chunk_size(field: str, ids: list[int], *, fixed_filter: str = "") -> int:
+    # Fit as many "field eq id" terms as the encoded $filter budget allows,
+    # sized for the longest id so every chunk stays under the limit.
+    term = quote(f"{field} eq {max(ids, default=0)} or ", safe=QUERY_SAFE_CHARS)
+    fixed = quote(fixed_filter, safe=QUERY_SAFE_CHARS)
+    return max(1, (ODA_FILTER_BUDGET - len(fixed)) // len(term))
 
 
 def collect_lookup_map(rows: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
-    return {int(row["id"]): row for row in rows}
+    return dict(zip(map(int, map(itemgetter("id"), rows)), rows))
 
 
 def row_value(row: dict[str, Any], *keys: str) -> Any:
@@ -706,11 +955,11 @@ def choose_latest_active(
     memberships: list[dict[str, Any]],
     on_date: date,
 ) -> dict[str, Any] | None:
-    active = [membership for membership in memberships if membership_active_on(membership, on_date)]
-    if not active:
-        return None
-    active.sort(key=membership_sort_key, reverse=True)
-    return active[0]
+    # build_memberships sorts each list newest first, so the first active one wins.
+    return next(
+        (membership for membership in memberships if membership_active_on(membership, on_date)),
+        None,
+    )
 
 
 def build_biography_fields(person: dict[str, Any]) -> dict[str, Any]:
@@ -718,17 +967,23 @@ def build_biography_fields(person: dict[str, Any]) -> dict[str, Any]:
     root = parse_biography_xml(biography)
     constituency_entries = xml_text_list(root, ".//career/constituencies/constituency")
     constituency = constituency_entries[0] if constituency_entries else None
+
+    def bio_text(tag: str) -> str | None:
+        # Prefer the parsed tree, but still fall back to the raw blob when the
+        # tag is empty or missing there, as the regex lookup always did.
+        if root is not None:
+            return xml_text(root, f".//{tag}") or extract_tag(biography, tag)
+        return extract_tag(biography, tag)
+
     return {
-        "member_url": normalize_member_url(xml_text(root, ".//url") or extract_tag(biography, "url")),
-        "photo_url": normalize_photo_url(xml_text(root, ".//pictureMiRes"))
-        or normalize_photo_url(xml_text(root, ".//pictureHiRes"))
-        or normalize_photo_url(extract_tag(biography, "pictureMiRes"))
-        or normalize_photo_url(extract_tag(biography, "pictureHiRes")),
-        "profession": xml_text(root, ".//profession") or extract_tag(biography, "profession"),
-        "title": xml_text(root, ".//title") or extract_tag(biography, "title"),
+        "member_url": normalize_member_url(bio_text("url")),
+        "photo_url": normalize_photo_url(bio_text("pictureMiRes"))
+        or normalize_photo_url(bio_text("pictureHiRes")),
+        "profession": bio_text("profession"),
+        "title": bio_text("title"),
         "current_constituency": constituency,
         "constituency_history": constituency_entries,
-        "party_short_from_bio": xml_text(root, ".//partyShortname") or extract_tag(biography, "partyShortname"),
+        "party_short_from_bio": bio_text("partyShortname"),
         "function_start_date": parse_iso_date(
             xml_text(root, ".//personalInformation/function/functionStartDate")
             or extract_tag(biography, "functionStartDate")
@@ -859,22 +1114,17 @@ def fetch_sag_actor_rows(
     if not sag_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(sag_ids), chunk_size):
-        chunk = sag_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("sagid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "SagAkt%C3%B8r",
-                params={"$filter": filter_expr},
-                label="sag-aktorer",
-            )
+        return client.fetch_collection(
+            "SagAkt%C3%B8r",
+            params={"$filter": filter_expr},
+            label="sag-aktorer",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, sag_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_sagstrin_for_sager(
@@ -887,11 +1137,9 @@ def fetch_sagstrin_for_sager(
     if not sag_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 20
 
-    for start in range(0, len(sag_ids), chunk_size):
-        chunk = sag_ids[start : start + chunk_size]
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         sag_filter = build_filter_for_ids("sagid", chunk)
         filters = [f"({sag_filter})"]
         if start_date and today_iso:
@@ -903,21 +1151,18 @@ def fetch_sagstrin_for_sager(
         elif today_iso:
             filters.append(f"dato le datetime'{today_iso}T23:59:59'")
 
-        rows.extend(
-            client.fetch_collection(
-                "Sagstrin",
-                params={
-                    "$filter": " and ".join(filters),
-                    "$orderby": "dato asc,id asc",
-                    "$expand": "Sag,Sagstrinstype,Sagstrinsstatus,Afstemning",
-                },
-                label="sagstrin-timeline",
-            )
+        return client.fetch_collection(
+            "Sagstrin",
+            params={
+                "$filter": " and ".join(filters),
+                "$orderby": "dato asc,id asc",
+                "$expand": "Sag,Sagstrinstype,Sagstrinsstatus,Afstemning",
+            },
+            label="sagstrin-timeline",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return sorted(deduped.values(), key=lambda item: ((item.get("dato") or ""), int(item["id"])))
+    rows = fetch_in_chunks(client, sag_ids, chunk_size, fetch_chunk, dedupe=True)
+    return sorted(rows, key=lambda item: ((item.get("dato") or ""), int(item["id"])))
 
 
 def fetch_sagstrin_documents(
@@ -925,23 +1170,20 @@ def fetch_sagstrin_documents(
     *,
     sagstrin_ids: list[int],
 ) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(sagstrin_ids), chunk_size):
-        chunk = sagstrin_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("sagstrinid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "SagstrinDokument",
-                params={
-                    "$filter": filter_expr,
-                    "$expand": "Dokument/Fil",
-                },
-                label="sagstrin-dokument",
-            )
+        return client.fetch_collection(
+            "SagstrinDokument",
+            params={
+                "$filter": filter_expr,
+                "$expand": "Dokument/Fil",
+            },
+            label="sagstrin-dokument",
         )
-        time.sleep(client.options.delay)
-    return rows
+
+    return fetch_in_chunks(client, sagstrin_ids, chunk_size, fetch_chunk)
 
 
 def fetch_dokument_actor_rows(
@@ -952,22 +1194,17 @@ def fetch_dokument_actor_rows(
     if not document_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(document_ids), chunk_size):
-        chunk = document_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("dokumentid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "DokumentAkt%C3%B8r",
-                params={"$filter": filter_expr},
-                label="dokument-aktorer",
-            )
+        return client.fetch_collection(
+            "DokumentAkt%C3%B8r",
+            params={"$filter": filter_expr},
+            label="dokument-aktorer",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, document_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_sager_by_ids(
@@ -978,25 +1215,20 @@ def fetch_sager_by_ids(
     if not sag_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(sag_ids), chunk_size):
-        chunk = sag_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("id", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Sag",
-                params={
-                    "$filter": filter_expr,
-                    "$top": len(chunk),
-                },
-                label="sag",
-            )
+        return client.fetch_collection(
+            "Sag",
+            params={
+                "$filter": filter_expr,
+                "$top": len(chunk),
+            },
+            label="sag",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, sag_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_dagsordenspunkt_rows(
@@ -1007,44 +1239,34 @@ def fetch_dagsordenspunkt_rows(
     if not sagstrin_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(sagstrin_ids), chunk_size):
-        chunk = sagstrin_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("sagstrinid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Dagsordenspunkt",
-                params={"$filter": filter_expr},
-                label="dagsordenspunkter",
-            )
+        return client.fetch_collection(
+            "Dagsordenspunkt",
+            params={"$filter": filter_expr},
+            label="dagsordenspunkter",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, sagstrin_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_moeder_by_ids(client: OdaClient, *, moede_ids: list[int]) -> list[dict[str, Any]]:
     if not moede_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(moede_ids), chunk_size):
-        chunk = moede_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("id", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "M%C3%B8de",
-                params={"$filter": filter_expr},
-                label="moeder",
-            )
+        return client.fetch_collection(
+            "M%C3%B8de",
+            params={"$filter": filter_expr},
+            label="moeder",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, moede_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_sagstrin_by_ids(
@@ -1055,26 +1277,21 @@ def fetch_sagstrin_by_ids(
     if not sagstrin_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(sagstrin_ids), chunk_size):
-        chunk = sagstrin_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("id", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Sagstrin",
-                params={
-                    "$filter": filter_expr,
-                    "$expand": "Sag,Sagstrinstype,Sagstrinsstatus,Afstemning",
-                    "$top": len(chunk),
-                },
-                label="sagstrin-lookup",
-            )
+        return client.fetch_collection(
+            "Sagstrin",
+            params={
+                "$filter": filter_expr,
+                "$expand": "Sag,Sagstrinstype,Sagstrinsstatus,Afstemning",
+                "$top": len(chunk),
+            },
+            label="sagstrin-lookup",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, sagstrin_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_sambehandling_rows(
@@ -1085,25 +1302,20 @@ def fetch_sambehandling_rows(
     if not sagstrin_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 20
-    for start in range(0, len(sagstrin_ids), chunk_size):
-        chunk = sagstrin_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         first_filter = build_filter_for_ids("førstesagstrinid", chunk)
         second_filter = build_filter_for_ids("andetsagstrinid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Sambehandlinger",
-                params={
-                    "$filter": f"({first_filter}) or ({second_filter})",
-                },
-                label="sambehandlinger",
-            )
+        return client.fetch_collection(
+            "Sambehandlinger",
+            params={
+                "$filter": f"({first_filter}) or ({second_filter})",
+            },
+            label="sambehandlinger",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, sagstrin_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_omtryk_rows(
@@ -1114,20 +1326,17 @@ def fetch_omtryk_rows(
     if not document_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(document_ids), chunk_size):
-        chunk = document_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("dokumentid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Omtryk",
-                params={"$filter": filter_expr},
-                label="omtryk",
-            )
+        return client.fetch_collection(
+            "Omtryk",
+            params={"$filter": filter_expr},
+            label="omtryk",
         )
-        time.sleep(client.options.delay)
-    return rows
+
+    return fetch_in_chunks(client, document_ids, chunk_size, fetch_chunk)
 
 
 def fetch_emneordsag_rows(
@@ -1138,20 +1347,17 @@ def fetch_emneordsag_rows(
     if not sag_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(sag_ids), chunk_size):
-        chunk = sag_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("sagid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "EmneordSag",
-                params={"$filter": filter_expr},
-                label="emneord-sag",
-            )
+        return client.fetch_collection(
+            "EmneordSag",
+            params={"$filter": filter_expr},
+            label="emneord-sag",
         )
-        time.sleep(client.options.delay)
-    return rows
+
+    return fetch_in_chunks(client, sag_ids, chunk_size, fetch_chunk)
 
 
 def fetch_emneorddokument_rows(
@@ -1162,20 +1368,17 @@ def fetch_emneorddokument_rows(
     if not document_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 40
-    for start in range(0, len(document_ids), chunk_size):
-        chunk = document_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("dokumentid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "EmneordDokument",
-                params={"$filter": filter_expr},
-                label="emneord-dokument",
-            )
+        return client.fetch_collection(
+            "EmneordDokument",
+            params={"$filter": filter_expr},
+            label="emneord-dokument",
         )
-        time.sleep(client.options.delay)
-    return rows
+
+    return fetch_in_chunks(client, document_ids, chunk_size, fetch_chunk)
 
 
 def fetch_emneord_rows(
@@ -1186,22 +1389,17 @@ def fetch_emneord_rows(
     if not emneord_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 60
-    for start in range(0, len(emneord_ids), chunk_size):
-        chunk = emneord_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         filter_expr = build_filter_for_ids("id", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Emneord",
-                params={"$filter": filter_expr, "$top": len(chunk)},
-                label="emneord",
-            )
+        return client.fetch_collection(
+            "Emneord",
+            params={"$filter": filter_expr, "$top": len(chunk)},
+            label="emneord",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, emneord_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def compute_min_period_kode(start_date: str) -> str:
@@ -1305,68 +1503,52 @@ def fetch_actor_relations_for_sources(
     source_actor_ids: list[int],
     start_date: str,
 ) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    chunk_size = 20
     active_filter = f"(slutdato eq null or slutdato ge datetime'{start_date}T00:00:00')"
+    chunk_size = id_filter_chunk_size("fraaktørid", source_actor_ids, fixed_filter=f"() and {active_filter}")
 
-    for start in range(0, len(source_actor_ids), chunk_size):
-        chunk = source_actor_ids[start : start + chunk_size]
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         source_filter = build_filter_for_ids("fraaktørid", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Akt%C3%B8rAkt%C3%B8r",
-                params={"$filter": f"({source_filter}) and {active_filter}"},
-                label="aktor-aktor",
-            )
+        return client.fetch_collection(
+            "Akt%C3%B8rAkt%C3%B8r",
+            params={"$filter": f"({source_filter}) and {active_filter}"},
+            label="aktor-aktor",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, source_actor_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_people_by_ids(client: OdaClient, *, person_ids: list[int]) -> list[dict[str, Any]]:
     if not person_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
-    chunk_size = 50
-    for start in range(0, len(person_ids), chunk_size):
-        chunk = person_ids[start : start + chunk_size]
+    chunk_size = id_filter_chunk_size("id", person_ids, fixed_filter="typeid eq 5 and ()")
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         id_filter = build_filter_for_ids("id", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Akt%C3%B8r",
-                params={"$filter": f"typeid eq 5 and ({id_filter})"},
-                label="people",
-            )
+        return client.fetch_collection(
+            "Akt%C3%B8r",
+            params={"$filter": f"typeid eq 5 and ({id_filter})"},
+            label="people",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, person_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def fetch_actors_by_ids(client: OdaClient, *, actor_ids: list[int]) -> list[dict[str, Any]]:
     if not actor_ids:
         return []
 
-    rows: list[dict[str, Any]] = []
     chunk_size = 50
-    for start in range(0, len(actor_ids), chunk_size):
-        chunk = actor_ids[start : start + chunk_size]
+
+    def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
         id_filter = build_filter_for_ids("id", chunk)
-        rows.extend(
-            client.fetch_collection(
-                "Akt%C3%B8r",
-                params={"$filter": id_filter},
-                label="actors",
-            )
+        return client.fetch_collection(
+            "Akt%C3%B8r",
+            params={"$filter": id_filter},
+            label="actors",
         )
-        time.sleep(client.options.delay)
 
-    deduped = {int(row["id"]): row for row in rows}
-    return list(deduped.values())
+    return fetch_in_chunks(client, actor_ids, chunk_size, fetch_chunk, dedupe=True)
 
 
 def _fetch_vote_stem_overflow(
@@ -1505,7 +1687,8 @@ def make_document_links(
     omtryk_by_document_id: dict[int, list[dict[str, Any]]] | None = None,
 ) -> dict[int, list[dict[str, Any]]]:
     omtryk_by_document_id = omtryk_by_document_id or {}
-    links_by_sag: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    links_by_sag: dict[int, list[dict[str, Any]]] = {}
+    seen_urls_by_id: dict[int, set[str]] = {}
 
     for row in sag_document_rows:
         sag_id = int(row["sagid"])
@@ -1517,13 +1700,17 @@ def make_document_links(
         url = file_row.get("filurl")
         if not url:
             continue
+        seen_urls = seen_urls_by_id.setdefault(sag_id, set())
+        if str(url) in seen_urls:
+            continue
+        seen_urls.add(str(url))
 
         role = (row.get("SagDokumentRolle") or {}).get("rolle")
         document_id = int(document["id"])
         omtryk_entries = omtryk_by_document_id.get(document_id, [])
         title_text = str(document.get("titel") or "")
         is_omtryk = bool(omtryk_entries) or ("omtryk" in title_text.lower()) or ("omtryk" in str(url).lower())
-        links_by_sag[sag_id].append(
+        links_by_sag.setdefault(sag_id, []).append(
             {
                 "document_id": document_id,
                 "title": document.get("titel"),
@@ -1538,18 +1725,7 @@ def make_document_links(
             }
         )
 
-    deduped: dict[int, list[dict[str, Any]]] = {}
-    for sag_id, links in links_by_sag.items():
-        seen: set[str] = set()
-        unique_links: list[dict[str, Any]] = []
-        for link in links:
-            url = str(link["url"])
-            if url in seen:
-                continue
-            seen.add(url)
-            unique_links.append(link)
-        deduped[sag_id] = unique_links
-    return deduped
+    return links_by_sag
 
 
 def make_sagstrin_document_links(
@@ -1558,7 +1734,8 @@ def make_sagstrin_document_links(
     omtryk_by_document_id: dict[int, list[dict[str, Any]]] | None = None,
 ) -> dict[int, list[dict[str, Any]]]:
     omtryk_by_document_id = omtryk_by_document_id or {}
-    links_by_sagstrin: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    links_by_sagstrin: dict[int, list[dict[str, Any]]] = {}
+    seen_urls_by_id: dict[int, set[str]] = {}
 
     for row in sagstrin_document_rows:
         sagstrin_id = int(row["sagstrinid"])
@@ -1570,12 +1747,16 @@ def make_sagstrin_document_links(
         url = file_row.get("filurl")
         if not url:
             continue
+        seen_urls = seen_urls_by_id.setdefault(sagstrin_id, set())
+        if str(url) in seen_urls:
+            continue
+        seen_urls.add(str(url))
 
         document_id = int(document["id"])
         omtryk_entries = omtryk_by_document_id.get(document_id, [])
         title_text = str(document.get("titel") or "")
         is_omtryk = bool(omtryk_entries) or ("omtryk" in title_text.lower()) or ("omtryk" in str(url).lower())
-        links_by_sagstrin[sagstrin_id].append(
+        links_by_sagstrin.setdefault(sagstrin_id, []).append(
             {
                 "document_id": document_id,
                 "title": document.get("titel"),
@@ -1589,18 +1770,7 @@ def make_sagstrin_document_links(
             }
         )
 
-    deduped: dict[int, list[dict[str, Any]]] = {}
-    for sagstrin_id, links in links_by_sagstrin.items():
-        seen: set[str] = set()
-        unique_links: list[dict[str, Any]] = []
-        for link in links:
-            url = str(link["url"])
-            if url in seen:
-                continue
-            seen.add(url)
-            unique_links.append(link)
-        deduped[sagstrin_id] = unique_links
-    return deduped
+    return links_by_sagstrin
 
 
 def make_case_document_links_from_sagstrin(
@@ -2521,158 +2691,160 @@ def derive_profiles(
     party_memberships, committee_memberships = build_memberships(actor_relations, actors_by_id, person_ids)
     vote_context_by_id = {int(vote["afstemning_id"]): vote for vote in votes}
 
-    member_vote_counts: dict[int, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    # Per member: [total, for, imod, fravær, hverken], indexed by Stemmetype id.
+    member_vote_counts: dict[int, list[int]] = {}
     member_recent_votes: dict[int, list[dict[str, Any]]] = defaultdict(list)
     latest_vote_date_by_person: dict[int, date] = {}
 
-    membership_cache: dict[tuple[int, str], dict[str, Any] | None] = {}
-    committee_cache: dict[tuple[int, str], list[dict[str, Any]]] = {}
+    membership_cache: dict[tuple[int, date], dict[str, Any] | None] = {}
+    committee_cache: dict[tuple[int, date], list[dict[str, Any]]] = {}
     loyalty_totals: dict[int, int] = defaultdict(int)
     loyalty_matches: dict[int, int] = defaultdict(int)
 
-    stems_by_vote: dict[int, list[dict[str, Any]]] = defaultdict(list)
-    for stem in stems:
-        vote_id = int(stem["afstemningid"])
-        if vote_id in vote_context_by_id:
-            stems_by_vote[vote_id].append(stem)
+    actor_id_keys = ("aktørid", "aktør_id", "aktoerid", "aktoer_id", "aktÃ¸rid", "aktÃƒÂ¸rid")
 
     def person_id_from_stem(stem: dict[str, Any]) -> int:
-        for key in ("aktørid", "aktør_id", "aktoerid", "aktoer_id", "aktÃ¸rid", "aktÃƒÂ¸rid"):
+        for key in actor_id_keys:
             raw_value = stem.get(key)
             if raw_value is not None:
                 return int(raw_value)
         raise KeyError("Missing actor id in stem row")
 
-    def party_for_person_on(person_id: int, when_iso: str) -> dict[str, Any] | None:
-        cache_key = (person_id, when_iso)
+    # Parse the actor and vote type once here and keep only rows for the
+    # members being profiled, grouped by vote.
+    stems_by_vote: dict[int, list[tuple[int, int]]] = defaultdict(list)
+    for stem in stems:
+        vote_id = int(stem["afstemningid"])
+        if vote_id not in vote_context_by_id:
+            continue
+        person_id = person_id_from_stem(stem)
+        if person_id in person_ids:
+            stems_by_vote[vote_id].append((person_id, int(stem["typeid"])))
+
+    def party_for_person_on(person_id: int, on_date: date) -> dict[str, Any] | None:
+        cache_key = (person_id, on_date)
         if cache_key in membership_cache:
             return membership_cache[cache_key]
         memberships = party_memberships.get(person_id, [])
-        membership = choose_latest_active(memberships, date.fromisoformat(when_iso))
+        membership = choose_latest_active(memberships, on_date)
         membership_cache[cache_key] = membership
         return membership
 
-    def committees_for_person_on(person_id: int, when_iso: str) -> list[dict[str, Any]]:
-        cache_key = (person_id, when_iso)
+    def committees_for_person_on(person_id: int, on_date: date) -> list[dict[str, Any]]:
+        cache_key = (person_id, on_date)
         if cache_key in committee_cache:
             return committee_cache[cache_key]
-        on_date = date.fromisoformat(when_iso)
+        # build_memberships already sorted each list newest first.
         memberships = [
             membership
             for membership in committee_memberships.get(person_id, [])
             if membership_active_on(membership, on_date)
         ]
-        memberships.sort(key=membership_sort_key, reverse=True)
         committee_cache[cache_key] = memberships
         return memberships
 
+    # Walk votes newest first: summarized_votes and every member's recent
+    # votes then come out in final order, and the first date seen per member
+    # is their latest.
     summarized_votes: list[dict[str, Any]] = []
-    for vote in votes:
+    for vote in sorted(votes, key=lambda item: (item["date"], item["afstemning_id"]), reverse=True):
         vote_id = int(vote["afstemning_id"])
         vote_date_iso = vote["date"]
-        vote_stems = stems_by_vote.get(vote_id, [])
-        party_vote_buckets: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
-
-        for stem in vote_stems:
-            person_id = person_id_from_stem(stem)
-            if person_id not in person_ids:
-                continue
-
-            vote_type_id = int(stem["typeid"])
-            member_vote_counts[person_id]["total"] += 1
-            member_vote_counts[person_id][str(vote_type_id)] += 1
-
-            latest_vote_date_by_person[person_id] = max(
-                latest_vote_date_by_person.get(person_id, date.min),
-                date.fromisoformat(vote_date_iso),
-            )
-
-            if vote_type_id in {1, 2, 4}:
-                party_membership = party_for_person_on(person_id, vote_date_iso)
-                if party_membership:
-                    party_key = str(party_membership["actor"]["id"])
-                    party_vote_buckets[party_key][vote_type_id] += 1
-
-            member_recent_votes[person_id].append(
-                {
-                    "afstemning_id": vote_id,
-                    "date": vote_date_iso,
-                    "vote_type_id": vote_type_id,
-                    "vote_type": stemmetyper.get(vote_type_id, {}).get("type"),
-                    "sag_number": vote.get("sag_number"),
-                    "sag_title": vote.get("sag_short_title") or vote.get("sag_title"),
-                    "vedtaget": vote.get("vedtaget"),
-                }
-            )
-
-        majority_by_party: dict[str, int] = {}
-        party_split_count = 0
-        for party_key, counts in party_vote_buckets.items():
-            sorted_counts = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
-            if len(sorted_counts) > 1 and sorted_counts[0][1] == sorted_counts[1][1]:
-                party_split_count += 1
-                continue
-            majority_by_party[party_key] = sorted_counts[0][0]
-            if len(sorted_counts) > 1:
-                party_split_count += 1
-
-        for stem in vote_stems:
-            person_id = person_id_from_stem(stem)
-            if person_id not in person_ids:
-                continue
-
-            vote_type_id = int(stem["typeid"])
-            if vote_type_id not in {1, 2, 4}:
-                continue
-
-            party_membership = party_for_person_on(person_id, vote_date_iso)
-            if not party_membership:
-                continue
-
-            majority_vote_type = majority_by_party.get(str(party_membership["actor"]["id"]))
-            if majority_vote_type is None:
-                continue
-
-            loyalty_totals[person_id] += 1
-            if majority_vote_type == vote_type_id:
-                loyalty_matches[person_id] += 1
-
-        counts: dict[int, int] = defaultdict(int)
+        vote_date = date.fromisoformat(vote_date_iso)
+        # Stemmetype ids run 1-4 (for, imod, fravær, hverken); slot 0 is unused.
+        counts = [0] * 5
+        # Per-party tallies use the same layout.
+        party_vote_buckets: dict[int, list[int]] = {}
         vote_groups: dict[str, list[int]] = {
             "for": [],
             "imod": [],
             "fravaer": [],
             "hverken": [],
         }
-        vote_groups_by_party: dict[str, dict[str, list[int]]] = defaultdict(
-            lambda: {
-                "for": [],
-                "imod": [],
-                "fravaer": [],
-                "hverken": [],
-            }
-        )
-        for stem in vote_stems:
-            person_id = person_id_from_stem(stem)
-            if person_id not in person_ids:
-                continue
+        vote_groups_by_party: dict[str, dict[str, list[int]]] = {}
+        # Loyalty needs each party's majority, which is only known once every
+        # stem has been seen; keep the eligible stems for a short second pass.
+        party_stems: list[tuple[int, int, int]] = []
+
+        for person_id, vote_type_id in stems_by_vote.get(vote_id, []):
+            party_membership = party_for_person_on(person_id, vote_date)
+            party_actor = party_membership["actor"] if party_membership else None
+            member_counts = member_vote_counts.get(person_id)
+            if member_counts is None:
+                member_counts = member_vote_counts[person_id] = [0] * 5
+            member_counts[0] += 1
+            # Only Stemmetype ids 1-4 have a slot; an unknown id still counts
+            # towards the member's total, as it always did.
+            if 1 <= vote_type_id <= 4:
+                member_counts[vote_type_id] += 1
+                counts[vote_type_id] += 1
+
+            latest_vote_date_by_person.setdefault(person_id, vote_date)
+
+            if vote_type_id in {1, 2, 4} and party_actor:
+                party_counts = party_vote_buckets.get(party_actor["id"])
+                if party_counts is None:
+                    party_counts = party_vote_buckets[party_actor["id"]] = [0] * 5
+                party_counts[vote_type_id] += 1
+                party_stems.append((person_id, vote_type_id, party_actor["id"]))
+
+            recent_votes = member_recent_votes[person_id]
+            if len(recent_votes) < recent_vote_limit:
+                recent_votes.append(
+                    {
+                        "afstemning_id": vote_id,
+                        "date": vote_date_iso,
+                        "vote_type_id": vote_type_id,
+                        "vote_type": stemmetyper.get(vote_type_id, {}).get("type"),
+                        "sag_number": vote.get("sag_number"),
+                        "sag_title": vote.get("sag_short_title") or vote.get("sag_title"),
+                        "vedtaget": vote.get("vedtaget"),
+                    }
+                )
 
-            vote_type_id = int(stem["typeid"])
-            counts[vote_type_id] += 1
             group_key = vote_group_key(vote_type_id)
             if group_key:
                 vote_groups[group_key].append(person_id)
-                party_membership = party_for_person_on(person_id, vote_date_iso)
-                party_actor = party_membership["actor"] if party_membership else None
                 party_key = (
                     party_actor.get("gruppenavnkort")
                     or party_actor.get("navn")
                     or "Uden parti"
                 ) if party_actor else "Uden parti"
-                vote_groups_by_party[party_key][group_key].append(person_id)
+                party_groups = vote_groups_by_party.get(party_key)
+                if party_groups is None:
+                    party_groups = vote_groups_by_party[party_key] = {
+                        "for": [],
+                        "imod": [],
+                        "fravaer": [],
+                        "hverken": [],
+                    }
+                party_groups[group_key].append(person_id)
+
+        majority_by_party: dict[int, int] = {}
+        party_split_count = 0
+        for party_id, type_counts in party_vote_buckets.items():
+            sorted_counts = sorted(
+                ((vote_type_id, count) for vote_type_id, count in enumerate(type_counts) if count),
+                key=lambda item: (-item[1], item[0]),
+            )
+            if len(sorted_counts) > 1 and sorted_counts[0][1] == sorted_counts[1][1]:
+                party_split_count += 1
+                continue
+            majority_by_party[party_id] = sorted_counts[0][0]
+            if len(sorted_counts) > 1:
+                party_split_count += 1
+
+        for person_id, vote_type_id, party_id in party_stems:
+            majority_vote_type = majority_by_party.get(party_id)
+            if majority_vote_type is None:
+                continue
+
+            loyalty_totals[person_id] += 1
+            if majority_vote_type == vote_type_id:
+                loyalty_matches[person_id] += 1
 
         counts_source = "stemme"
-        if counts.get(1, 0) == 0 and counts.get(2, 0) == 0:
+        if counts[1] == 0 and counts[2] == 0:
             parsed_counts = parse_counts_from_konklusion(vote.get("konklusion"))
             if parsed_counts and (
                 parsed_counts["for"] > 0
@@ -2686,43 +2858,46 @@ def derive_profiles(
                 counts[4] = parsed_counts["hverken"]
                 counts_source = "konklusion"
 
-        summarized_votes.append(
+        # The vote context rows are built for this call only, so extend them in
+        # place rather than copying every key into a new dict.
+        vote.update(
             {
-                **vote,
                 "counts": {
-                    "for": counts.get(1, 0),
-                    "imod": counts.get(2, 0),
-                    "fravaer": counts.get(3, 0),
-                    "hverken": counts.get(4, 0),
+                    "for": counts[1],
+                    "imod": counts[2],
+                    "fravaer": counts[3],
+                    "hverken": counts[4],
                 },
                 "vote_groups": vote_groups,
                 "vote_groups_by_party": vote_groups_by_party,
                 "party_split_count": party_split_count,
-                "margin": abs(counts.get(1, 0) - counts.get(2, 0)),
+                "margin": abs(counts[1] - counts[2]),
                 "counts_source": counts_source,
             }
         )
+        summarized_votes.append(vote)
 
     now = datetime.now(timezone.utc).date()
     current_party_member_ids: dict[int, set[int]] = defaultdict(set)
     current_committee_member_ids: dict[int, set[int]] = defaultdict(set)
+    currently_seated_ids: set[int] = set()
 
     for person in people:
         person_id = int(person["id"])
-        current_party = choose_latest_active(party_memberships.get(person_id, []), now)
-        current_committees = committees_for_person_on(person_id, now.isoformat())
+        current_party = party_for_person_on(person_id, now)
+        current_committees = committees_for_person_on(person_id, now)
 
         if current_party:
             current_party_member_ids[int(current_party["actor"]["id"])].add(person_id)
         for committee_membership in current_committees:
             current_committee_member_ids[int(committee_membership["actor"]["id"])].add(person_id)
+        if current_party or current_committees:
+            currently_seated_ids.add(person_id)
 
     included_person_ids = {
         person_id
         for person_id in person_ids
-        if member_vote_counts.get(person_id)
-        or any(person_id in member_ids for member_ids in current_party_member_ids.values())
-        or any(person_id in member_ids for member_ids in current_committee_member_ids.values())
+        if member_vote_counts.get(person_id) or person_id in currently_seated_ids
     }
 
     profiles: list[dict[str, Any]] = []
@@ -2732,26 +2907,23 @@ def derive_profiles(
             continue
 
         bio_fields = build_biography_fields(person)
-        current_party = choose_latest_active(party_memberships.get(person_id, []), now)
+        current_party = party_for_person_on(person_id, now)
         party_history = build_party_history(party_memberships.get(person_id, []), on_date=now)
-        current_committees = committees_for_person_on(person_id, now.isoformat())
+        current_committees = committees_for_person_on(person_id, now)
         latest_vote_date = latest_vote_date_by_person.get(person_id)
-        last_vote_party = (
-            party_for_person_on(person_id, latest_vote_date.isoformat()) if latest_vote_date else None
-        )
+        last_vote_party = party_for_person_on(person_id, latest_vote_date) if latest_vote_date else None
         display_party = current_party or last_vote_party
         party_actor = display_party["actor"] if display_party else None
         constituency_text = bio_fields.get("current_constituency")
 
         recent_votes = member_recent_votes.get(person_id, [])
-        recent_votes.sort(key=lambda item: (item["date"], item["afstemning_id"]), reverse=True)
-
-        counts = member_vote_counts.get(person_id, {})
-        votes_for = counts.get("1", 0)
-        votes_against = counts.get("2", 0)
-        votes_absent = counts.get("3", 0)
-        votes_neither = counts.get("4", 0)
-        total_votes = counts.get("total", 0)
+
+        counts = member_vote_counts.get(person_id) or [0] * 5
+        votes_for = counts[1]
+        votes_against = counts[2]
+        votes_absent = counts[3]
+        votes_neither = counts[4]
+        total_votes = counts[0]
         member_since_date = bio_fields.get("function_start_date") or parse_iso_date(person.get("startdato"))
         seniority_label, seniority_years, seniority_months = format_seniority_label(member_since_date, now)
 
@@ -2814,7 +2986,7 @@ def derive_profiles(
                 ),
                 "party_loyalty_matches": loyalty_matches.get(person_id, 0),
                 "party_loyalty_comparisons": loyalty_totals.get(person_id, 0),
-                "recent_votes": recent_votes[:recent_vote_limit],
+                "recent_votes": recent_votes,
             }
         )
 
@@ -2829,9 +3001,10 @@ def derive_profiles(
     party_summaries: list[dict[str, Any]] = []
     for party in parties:
         party_id = int(party["id"])
-        member_ids = sorted(current_party_member_ids.get(party_id, set()))
-        if not member_ids:
+        current_member_ids = current_party_member_ids.get(party_id)
+        if not current_member_ids:
             continue
+        member_ids = sorted(current_member_ids)
         party_summaries.append(
             {
                 "id": party_id,
@@ -2846,9 +3019,10 @@ def derive_profiles(
     committee_summaries: list[dict[str, Any]] = []
     for committee in committees:
         committee_id = int(committee["id"])
-        member_ids = sorted(current_committee_member_ids.get(committee_id, set()))
-        if not member_ids:
+        current_member_ids = current_committee_member_ids.get(committee_id)
+        if not current_member_ids:
             continue
+        member_ids = sorted(current_member_ids)
         committee_summaries.append(
             {
                 "id": committee_id,
@@ -2868,7 +3042,6 @@ def derive_profiles(
         "individual_vote_count": len(stems),
     }
 
-    summarized_votes.sort(key=lambda item: (item["date"], item["afstemning_id"]), reverse=True)
     return profiles, party_summaries, committee_summaries, summarized_votes, metadata
 
 
@@ -2897,8 +3070,7 @@ def _wikidata_search(name: str, language: str) -> list[dict[str, Any]]:
     return results
 
 
-def _wikidata_candidate_name_score(query: str, candidate: str) -> int:
-    normalized_query = normalize_name_text(query)
+def _wikidata_candidate_name_score(normalized_query: str, candidate: str) -> int:
     normalized_candidate = normalize_name_text(candidate)
     if not normalized_query or not normalized_candidate:
         return 0
@@ -2920,23 +3092,23 @@ def _wikidata_candidate_name_score(query: str, candidate: str) -> int:
     return score
 
 
-def _wikidata_candidate_score(name: str, result: dict[str, Any]) -> int:
-    score = _wikidata_candidate_name_score(name, result.get("label") or "")
+def _wikidata_candidate_score(normalized_name: str, result: dict[str, Any]) -> int:
+    score = _wikidata_candidate_name_score(normalized_name, result.get("label") or "")
 
     for alias in result.get("aliases", []):
-        score = max(score, _wikidata_candidate_name_score(name, alias) + 18)
+        score = max(score, _wikidata_candidate_name_score(normalized_name, alias) + 18)
 
     match = result.get("match") or {}
     match_text = match.get("text") or ""
     if match_text:
-        score = max(score, _wikidata_candidate_name_score(name, match_text) + 22)
+        score = max(score, _wikidata_candidate_name_score(normalized_name, match_text) + 22)
 
     description = (result.get("description") or "").lower()
-    if any(keyword in description for keyword in WIKIDATA_POSITIVE_DESC_KEYWORDS):
+    if WIKIDATA_POSITIVE_DESC_PATTERN.search(description):
         score += 24
-    if any(keyword in description for keyword in WIKIDATA_POSITIVE_NATIONALITY_KEYWORDS):
+    if WIKIDATA_POSITIVE_NATIONALITY_PATTERN.search(description):
         score += 8
-    if any(keyword in description for keyword in WIKIDATA_NEGATIVE_DESC_KEYWORDS):
+    if WIKIDATA_NEGATIVE_DESC_PATTERN.search(description):
         score -= 18
 
     if (match.get("type") or "") == "alias":
@@ -2969,11 +3141,7 @@ def _wikidata_entity_has_political_signal(entity: dict[str, Any], fallback_descr
         if isinstance(value, dict)
     ]
     descriptions = description_values + [fallback_description.lower()]
-    if any(
-        keyword in description
-        for description in descriptions
-        for keyword in WIKIDATA_POSITIVE_DESC_KEYWORDS
-    ):
+    if any(WIKIDATA_POSITIVE_DESC_PATTERN.search(description) for description in descriptions):
         return True
 
     position_ids = {
@@ -2989,13 +3157,14 @@ def _wikidata_entity_has_political_signal(entity: dict[str, Any], fallback_descr
 
 def _wikidata_photo_url(name: str) -> str | None:
     """Search Wikidata for a person by name and return their Wikimedia Commons image URL."""
+    normalized_name = normalize_name_text(name)
     candidates: dict[str, dict[str, Any]] = {}
     for language in ("da", "en"):
         for result in _wikidata_search(name, language):
             qid = result.get("id")
             if not qid:
                 continue
-            score = _wikidata_candidate_score(name, result)
+            score = _wikidata_candidate_score(normalized_name, result)
             previous = candidates.get(qid)
             if previous is None or score > previous["score"]:
                 candidates[qid] = {"result": result, "score": score}
@@ -3030,7 +3199,7 @@ def _wikidata_photo_url(name: str) -> str | None:
         if fname.lower().endswith((".svg", ".tif", ".tiff", ".pdf")):
             continue
 
-        md5 = hashlib.md5(fname.encode("utf-8")).hexdigest()
+        md5 = hashlib.md5(fname.encode("utf-8"), usedforsecurity=False).hexdigest()
         return f"https://upload.wikimedia.org/wikipedia/commons/{md5[0]}/{md5[:2]}/{quote(fname)}"
 
     return None
@@ -3042,7 +3211,7 @@ def _download_one_photo(
     photos_dir: Path,
 ) -> tuple[int, str | None]:
     # Return cached photo if it already exists (any common extension)
-    for ext in (".jpg", ".jpeg", ".png", ".webp", ".gif"):
+    for ext in LOCAL_PHOTO_EXTENSIONS:
         cached = photos_dir / f"{person_id}{ext}"
         if cached.exists():
             return person_id, f"photos/{person_id}{ext}"
@@ -3066,7 +3235,11 @@ def _download_one_photo(
             content_type = resp.headers.get("Content-Type", "")
             if not content_type.startswith("image/"):
                 return person_id, None
-            target.write_bytes(resp.read())
+            # Stream to a .part file so an interrupted download never looks cached.
+            partial = target.with_name(target.name + ".part")
+            with partial.open("wb") as handle:
+                shutil.copyfileobj(resp, handle, 1 << 16)
+            os.replace(partial, target)
             return person_id, f"photos/{person_id}{ext}"
     except Exception:
         return person_id, None
@@ -3365,6 +3538,8 @@ def main() -> None:
         delay=max(args.delay, 0),
         page_size=max(args.page_size, 1),
         verbose=args.verbose,
+        workers=max(args.chunk_workers, 1),
+        lookup_cache_dir=None if args.no_lookup_cache else Path(args.raw_dir) / "lookup_cache",
     )
     client = OdaClient(options)
 
@@ -3404,17 +3579,17 @@ def main() -> None:
         sag_rows_by_id = {int(row["id"]): row for row in sag_rows}
         sagstrin_ids = sorted({int(row["id"]) for row in timeline_sagstrin_rows})
         log(options.verbose, "timeline-only: fetching lookup tables for metadata")
-        actor_types = client.fetch_collection("Akt%C3%B8rtype", label="aktortype")
-        sag_actor_role_rows = client.fetch_collection("SagAkt%C3%B8rRolle", label="sag-aktor-rolle")
-        sagstype_rows = client.fetch_collection("Sagstype", label="sagstype")
-        sagsstatus_rows = client.fetch_collection("Sagsstatus", label="sagsstatus")
-        sagskategori_rows = client.fetch_collection("Sagskategori", label="sagskategori")
-        dokument_actor_role_rows = client.fetch_collection("DokumentAkt%C3%B8rRolle", label="dokument-aktor-rolle")
-        dokument_type_rows = client.fetch_collection("Dokumenttype", label="dokumenttype")
-        dokument_status_rows = client.fetch_collection("Dokumentstatus", label="dokumentstatus")
-        dokumentkategori_rows = client.fetch_collection("Dokumentkategori", label="dokumentkategori")
-        moedetype_rows = client.fetch_collection("M%C3%B8detype", label="moedetype")
-        moedestatus_rows = client.fetch_collection("M%C3%B8destatus", label="moedestatus")
+        actor_types = client.fetch_lookup_table("Akt%C3%B8rtype", label="aktortype")
+        sag_actor_role_rows = client.fetch_lookup_table("SagAkt%C3%B8rRolle", label="sag-aktor-rolle")
+        sagstype_rows = client.fetch_lookup_table("Sagstype", label="sagstype")
+        sagsstatus_rows = client.fetch_lookup_table("Sagsstatus", label="sagsstatus")
+        sagskategori_rows = client.fetch_lookup_table("Sagskategori", label="sagskategori")
+        dokument_actor_role_rows = client.fetch_lookup_table("DokumentAkt%C3%B8rRolle", label="dokument-aktor-rolle")
+        dokument_type_rows = client.fetch_lookup_table("Dokumenttype", label="dokumenttype")
+        dokument_status_rows = client.fetch_lookup_table("Dokumentstatus", label="dokumentstatus")
+        dokumentkategori_rows = client.fetch_lookup_table("Dokumentkategori", label="dokumentkategori")
+        moedetype_rows = client.fetch_lookup_table("M%C3%B8detype", label="moedetype")
+        moedestatus_rows = client.fetch_lookup_table("M%C3%B8destatus", label="moedestatus")
 
         log(options.verbose, f"timeline-only: fetching sambehandlinger for {len(sagstrin_ids)} sagstrin")
         sambehandling_rows = fetch_sambehandling_rows(client, sagstrin_ids=sagstrin_ids)
@@ -3607,7 +3782,7 @@ def main() -> None:
             }
         )
         emneord_rows = fetch_emneord_rows(client, emneord_ids=emneord_ids)
-        emneordstype_rows = client.fetch_collection("Emneordstype", label="emneordstype")
+        emneordstype_rows = client.fetch_lookup_table("Emneordstype", label="emneordstype")
         emneord_lookup = build_emneord_lookup(emneord_rows, emneordstype_rows)
         sag_emneord_by_sag = build_sag_emneord_map(emneordsag_rows, emneord_lookup)
         document_emneord_by_document_id = build_document_emneord_map(emneorddokument_rows, emneord_lookup)
@@ -3650,18 +3825,13 @@ def main() -> None:
         return
 
     log(options.verbose, "fetching lookup tables")
-    actor_types = client.fetch_collection("Akt%C3%B8rtype", label="aktortype")
-    stemmetyper = client.fetch_collection("Stemmetype", label="stemmetype")
-    afstemningstyper = client.fetch_collection("Afstemningstype", label="afstemningstype")
+    actor_types = client.fetch_lookup_table("Akt%C3%B8rtype", label="aktortype")
+    stemmetyper = client.fetch_lookup_table("Stemmetype", label="stemmetype")
+    afstemningstyper = client.fetch_lookup_table("Afstemningstype", label="afstemningstype")
 
     log(options.verbose, "determining vote window")
     vote_window, sagstrin_rows = determine_vote_window(client, start_date=start_date, today_iso=today_iso)
 
-    allowed_vote_ids = {
-        int(vote_row["id"])
-        for sagstrin_row in sagstrin_rows
-        for vote_row in (sagstrin_row.get("Afstemning") or [])
-    }
     log(options.verbose, "extracting vote records from expanded vote pages")
     stems = extract_vote_records(
         client,
@@ -3679,8 +3849,14 @@ def main() -> None:
         params={"$filter": active_actor_filter},
         label="org-actors",
     )
-    parties = [row for row in org_actors if int(row["typeid"]) == 4]
-    committees = [row for row in org_actors if int(row["typeid"]) == 3]
+    parties: list[dict[str, Any]] = []
+    committees: list[dict[str, Any]] = []
+    for row in org_actors:
+        actor_type = int(row["typeid"])
+        if actor_type == 4:
+            parties.append(row)
+        elif actor_type == 3:
+            committees.append(row)
 
     log(options.verbose, "fetching relevant actor relations")
     source_actor_ids = sorted(int(row["id"]) for row in org_actors)
@@ -3689,16 +3865,9 @@ def main() -> None:
         source_actor_ids=source_actor_ids,
         start_date=start_date,
     )
-    person_ids = sorted(
-        {
-            int(row["aktørid"])
-            for row in stems
-        }
-        | {
-            int(row["tilaktørid"])
-            for row in actor_relations
-        }
-    )
+    person_id_set = {int(row["aktørid"]) for row in stems}
+    person_id_set.update(int(row["tilaktørid"]) for row in actor_relations)
+    person_ids = sorted(person_id_set)
     people = fetch_people_by_ids(client, person_ids=person_ids)
 
     stemmetype_lookup = collect_lookup_map(stemmetyper)
@@ -3712,16 +3881,16 @@ def main() -> None:
     sag_rows_by_id = {int(row["id"]): row for row in sag_rows}
     sagstrin_ids = sorted({int(row["id"]) for row in timeline_sagstrin_rows})
     log(options.verbose, "fetching lookup tables for timeline metadata")
-    sag_actor_role_rows = client.fetch_collection("SagAkt%C3%B8rRolle", label="sag-aktor-rolle")
-    sagstype_rows = client.fetch_collection("Sagstype", label="sagstype")
-    sagsstatus_rows = client.fetch_collection("Sagsstatus", label="sagsstatus")
-    sagskategori_rows = client.fetch_collection("Sagskategori", label="sagskategori")
-    dokument_actor_role_rows = client.fetch_collection("DokumentAkt%C3%B8rRolle", label="dokument-aktor-rolle")
-    dokument_type_rows = client.fetch_collection("Dokumenttype", label="dokumenttype")
-    dokument_status_rows = client.fetch_collection("Dokumentstatus", label="dokumentstatus")
-    dokumentkategori_rows = client.fetch_collection("Dokumentkategori", label="dokumentkategori")
-    moedetype_rows = client.fetch_collection("M%C3%B8detype", label="moedetype")
-    moedestatus_rows = client.fetch_collection("M%C3%B8destatus", label="moedestatus")
+    sag_actor_role_rows = client.fetch_lookup_table("SagAkt%C3%B8rRolle", label="sag-aktor-rolle")
+    sagstype_rows = client.fetch_lookup_table("Sagstype", label="sagstype")
+    sagsstatus_rows = client.fetch_lookup_table("Sagsstatus", label="sagsstatus")
+    sagskategori_rows = client.fetch_lookup_table("Sagskategori", label="sagskategori")
+    dokument_actor_role_rows = client.fetch_lookup_table("DokumentAkt%C3%B8rRolle", label="dokument-aktor-rolle")
+    dokument_type_rows = client.fetch_lookup_table("Dokumenttype", label="dokumenttype")
+    dokument_status_rows = client.fetch_lookup_table("Dokumentstatus", label="dokumentstatus")
+    dokumentkategori_rows = client.fetch_lookup_table("Dokumentkategori", label="dokumentkategori")
+    moedetype_rows = client.fetch_lookup_table("M%C3%B8detype", label="moedetype")
+    moedestatus_rows = client.fetch_lookup_table("M%C3%B8destatus", label="moedestatus")
 
     log(options.verbose, f"fetching sambehandlinger for {len(sagstrin_ids)} sagstrin")
     sambehandling_rows = fetch_sambehandling_rows(client, sagstrin_ids=sagstrin_ids)
@@ -3914,7 +4083,7 @@ def main() -> None:
         }
     )
     emneord_rows = fetch_emneord_rows(client, emneord_ids=emneord_ids)
-    emneordstype_rows = client.fetch_collection("Emneordstype", label="emneordstype")
+    emneordstype_rows = client.fetch_lookup_table("Emneordstype", label="emneordstype")
     emneord_lookup = build_emneord_lookup(emneord_rows, emneordstype_rows)
     sag_emneord_by_sag = build_sag_emneord_map(emneordsag_rows, emneord_lookup)
     document_emneord_by_document_id = build_document_emneord_map(emneorddokument_rows, emneord_lookup)
@@ -3999,56 +4168,66 @@ def main() -> None:
     if not args.skip_photos:
         apply_local_photo_inventory(profiles, photos_dir)
 
-    write_json(output_dir / "profiler.json", profiles)
-    write_json(output_dir / "partier.json", party_summaries)
-    write_json(output_dir / "udvalg.json", committee_summaries)
-    write_json(output_dir / "afstemninger.json", summarized_votes)
-    write_json_compact(output_dir / "afstemninger_meta.json", vote_meta)
-    write_json_compact(output_dir / "afstemninger_overblik.json", vote_overview)
-    write_json_compact(output_dir / "afstemninger_detaljer.json", vote_details)
-    write_json_compact(output_dir / "afstemninger_detaljer_index.json", vote_detail_index)
-    write_json_shards(output_dir / "afstemninger_detaljer_shards", vote_detail_shards)
-    write_profile_vote_id_files(
-        output_dir / "profile_vote_ids",
-        profiles=profiles,
-        vote_ids_by_person=vote_ids_by_person,
-    )
-    write_json(output_dir / "moeder.json", meeting_overview)
-    write_json(output_dir / "sag_tidslinjer.json", case_timelines)
-    write_json_compact(output_dir / "sag_tidslinjer_index.json", timeline_index)
-    write_json_shards(output_dir / "sag_tidslinjer_shards", timeline_shards)
-    write_json_compact(output_dir / "love_og_regler.json", law_lookup_rows)
-    write_json(output_dir / "site_stats.json", site_stats)
-    write_json(output_dir / "ft_dokumenter_rf.json", rf_docs)
-    write_javascript_payload(
-        output_dir.parent / "catalog.js",
-        "__FOLKEVALGET_BOOTSTRAP__",
-        {
-            "profiles": profiles,
-            "parties": party_summaries,
-            "stats": site_stats,
-        },
-    )
-    write_javascript_payload(
-        output_dir.parent / "vote-catalog.js",
-        "__FOLKEVALGET_VOTES__",
-        {
-            "votes": summarized_votes,
-        },
-    )
+    # The four big payloads encode and flush on worker threads while the
+    # smaller files are written here; nothing below mutates their inputs.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        large_write_futures = [
+            executor.submit(write_json, output_dir / "profiler.json", profiles),
+            executor.submit(write_json, output_dir / "afstemninger.json", summarized_votes),
+            executor.submit(
+                write_javascript_payload,
+                output_dir.parent / "catalog.js",
+                "__FOLKEVALGET_BOOTSTRAP__",
+                {
+                    "profiles": profiles,
+                    "parties": party_summaries,
+                    "stats": site_stats,
+                },
+            ),
+            executor.submit(
+                write_javascript_payload,
+                output_dir.parent / "vote-catalog.js",
+                "__FOLKEVALGET_VOTES__",
+                {
+                    "votes": summarized_votes,
+                },
+            ),
+        ]
+
+        write_json(output_dir / "partier.json", party_summaries)
+        write_json(output_dir / "udvalg.json", committee_summaries)
+        write_json_compact(output_dir / "afstemninger_meta.json", vote_meta)
+        write_json_compact(output_dir / "afstemninger_overblik.json", vote_overview)
+        write_json_compact(output_dir / "afstemninger_detaljer.json", vote_details)
+        write_json_compact(output_dir / "afstemninger_detaljer_index.json", vote_detail_index)
+        write_json_shards(output_dir / "afstemninger_detaljer_shards", vote_detail_shards)
+        write_profile_vote_id_files(
+            output_dir / "profile_vote_ids",
+            profiles=profiles,
+            vote_ids_by_person=vote_ids_by_person,
+        )
+        write_json(output_dir / "moeder.json", meeting_overview)
+        write_json(output_dir / "sag_tidslinjer.json", case_timelines)
+        write_json_compact(output_dir / "sag_tidslinjer_index.json", timeline_index)
+        write_json_shards(output_dir / "sag_tidslinjer_shards", timeline_shards)
+        write_json_compact(output_dir / "love_og_regler.json", law_lookup_rows)
+        write_json(output_dir / "site_stats.json", site_stats)
+        write_json(output_dir / "ft_dokumenter_rf.json", rf_docs)
+        for future in large_write_futures:
+            future.result()
 
     if args.write_raw:
-        write_json(raw_dir / "actor_types.json", actor_types)
-        write_json(raw_dir / "stemmetyper.json", stemmetyper)
-        write_json(raw_dir / "afstemningstyper.json", afstemningstyper)
-        write_json(raw_dir / "aktorer_personer.json", people)
-        write_json(raw_dir / "aktorer_partier.json", parties)
-        write_json(raw_dir / "aktorer_udvalg.json", committees)
-        write_json(raw_dir / "aktor_aktor.json", actor_relations)
-        write_json(raw_dir / "sagstrin.json", sagstrin_rows)
-        write_json(raw_dir / "stemmer.json", stems)
-        write_json(raw_dir / "sag_dokumenter.json", sag_document_rows)
-        write_json(raw_dir / "sagstrin_dokumenter.json", sagstrin_document_rows)
+        write_raw_ndjson(raw_dir / "actor_types.ndjson.gz", actor_types)
+        write_raw_ndjson(raw_dir / "stemmetyper.ndjson.gz", stemmetyper)
+        write_raw_ndjson(raw_dir / "afstemningstyper.ndjson.gz", afstemningstyper)
+        write_raw_ndjson(raw_dir / "aktorer_personer.ndjson.gz", people)
+        write_raw_ndjson(raw_dir / "aktorer_partier.ndjson.gz", parties)
+        write_raw_ndjson(raw_dir / "aktorer_udvalg.ndjson.gz", committees)
+        write_raw_ndjson(raw_dir / "aktor_aktor.ndjson.gz", actor_relations)
+        write_raw_ndjson(raw_dir / "sagstrin.ndjson.gz", sagstrin_rows)
+        write_raw_ndjson(raw_dir / "stemmer.ndjson.gz", stems)
+        write_raw_ndjson(raw_dir / "sag_dokumenter.ndjson.gz", sag_document_rows)
+        write_raw_ndjson(raw_dir / "sagstrin_dokumenter.ndjson.gz", sagstrin_document_rows)
 
     print(
         json.dumps(
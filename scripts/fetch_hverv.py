@@ -16,7 +16,8 @@ registreret. Noteres eksplicit i output.
 Brug:
     python3 scripts/fetch_hverv.py                         # fuld kørsel
     python3 scripts/fetch_hverv.py --dry-run               # test mod 5 MF'ere
-    python3 scripts/fetch_hverv.py --delay 2.0             # roligere tempo
+    python3 scripts/fetch_hverv.py --delay 2.0             # roligere tempo (samlet for alle faner)
+    python3 scripts/fetch_hverv.py --concurrency 1         # én fane ad gangen
     python3 scripts/fetch_hverv.py --no-cvr                # spring CVR over
     python3 scripts/fetch_hverv.py --chrome-path "C:/..."  # angiv Chrome-sti
 """
@@ -25,28 +26,54 @@ from __future__ import annotations
 
 import argparse
 import json
+import queue
 import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 ROOT = Path(__file__).parent.parent
 DATA_DIR = ROOT / "data"
 PROFILER_FILE = DATA_DIR / "profiler.json"
 OUTPUT_FILE = DATA_DIR / "hverv.json"
+PROGRESS_FILE = DATA_DIR / "hverv.progress.jsonl"
+CVR_CACHE_FILE = DATA_DIR / ".cvr_opslag_cache.json"
+
+PROFIL_FELTER = ("id", "name", "member_url")
 
 DEFAULT_DELAY = 1.5
 CVR_DELAY = 0.3
+CVR_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+CVR_CACHE_SAVE_EVERY = 25
 REQUEST_TIMEOUT = 30
 DEBUG_PORT = 9231
+CDP_URL = f"http://127.0.0.1:{DEBUG_PORT}"
+DEFAULT_CONCURRENCY = 3
+
+FT_ORIGIN = "https://www.ft.dk/"
+ARTICLE_STRAINER = SoupStrainer("article")
+HENT_HVERV_SCRIPT = """
+async (url) => {
+  const response = await fetch(url, { credentials: "include" });
+  if (!response.ok) {
+    return null;
+  }
+  const doc = new DOMParser().parseFromString(await response.text(), "text/html");
+  const hverv = doc.querySelector("#hverv");
+  return hverv ? hverv.innerHTML : null;
+}
+"""
 
 DEFAULT_CHROME_PATHS = (
     Path(r"C:\Program Files\Google\Chrome\Application\chrome.exe"),
@@ -55,6 +82,8 @@ DEFAULT_CHROME_PATHS = (
 )
 
 CVR_SEARCH_URL = "https://cvrapi.dk/api"
+# Virksomhedsnavne står typisk i citationstegn i hvervbeskrivelsen.
+CITAT_PATTERN = re.compile(r'[""«»„]([^""«»„]+)[""«»„]')
 CVR_HEADERS = {
     "User-Agent": "folkevalget-data-fetcher/1.0 (https://folkevalget.dk)",
     "Accept": "application/json",
@@ -101,12 +130,33 @@ def mf_url(profil: dict) -> str:
     return url
 
 
+def hent_hverv_direkte(page, url: str) -> str | None:
+    """Hent MF-siden med fetch() inde i fanen og returner #hverv, eller None.
+
+    Kører i den rigtige Chrome med fanens cookies og fingerprint, så
+    Cloudflare-clearance gælder, men uden at rendere siden, køre dens
+    scripts eller hente billeder. Kræver at fanen allerede står på ft.dk.
+    """
+    if not page.url.startswith(FT_ORIGIN):
+        return None
+    try:
+        return page.evaluate(HENT_HVERV_SCRIPT, url)
+    except Exception:
+        return None
+
+
 def hent_hverv_html(page, url: str, timeout_sek: int = 60, retries: int = 3) -> str | None:
-    """Naviger til MF-side og returner inner_html af #hverv-div, eller None.
+    """Returner inner_html af MF-sidens #hverv-div, eller None.
 
-    Prøver op til `retries` gange — Cloudflare kan rejse en ny challenge
-    midt i en kørsel, og en enkelt genindlæsning løser det typisk.
+    Prøver først en direkte hentning; giver den ikke en #hverv-sektion
+    (CF-challenge, manglende sektion), navigeres der til siden som før.
+    Navigationen prøves op til `retries` gange — Cloudflare kan rejse en ny
+    challenge midt i en kørsel, og en enkelt genindlæsning løser det typisk.
     """
+    hverv_html = hent_hverv_direkte(page, url)
+    if hverv_html is not None:
+        return hverv_html
+
     for forsøg in range(1, retries + 1):
         try:
             page.goto(url, wait_until="domcontentloaded", timeout=timeout_sek * 1000)
@@ -144,7 +194,8 @@ def hent_hverv_html(page, url: str, timeout_sek: int = 60, retries: int = 3) ->
 
 def parsér_hverv_html(html_tekst: str) -> list[dict]:
     """Parsér rå inner_html fra #hverv-div og returner strukturerede poster."""
-    soup = BeautifulSoup(html_tekst, "html.parser")
+    # Kun <article>-elementerne bærer poster; resten af sektionen bygges ikke.
+    soup = BeautifulSoup(html_tekst, "html.parser", parse_only=ARTICLE_STRAINER)
     poster = []
     for article in soup.find_all("article"):
         if article.find("h3"):           # header-artikel
@@ -167,8 +218,39 @@ def parsér_hverv_html(html_tekst: str) -> list[dict]:
 # CVR-berigelse via cvrapi.dk
 # ---------------------------------------------------------------------------
 
-def cvr_opslag(session: requests.Session, virksomhedsnavn: str) -> dict | None:
-    """Slå virksomhed op i CVR. Returnerer dict eller None."""
+def cvr_nøgle(virksomhedsnavn: str) -> str:
+    return unicodedata.normalize("NFKD", virksomhedsnavn).casefold().strip()
+
+
+def indlæs_cvr_cache(path: Path) -> dict[str, dict]:
+    """Læs CVR-svar fra tidligere kørsler; poster ældre end CVR_CACHE_MAX_AGE droppes."""
+    try:
+        rå = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+    grænse = time.time() - CVR_CACHE_MAX_AGE
+    return {
+        nøgle: post for nøgle, post in rå.items()
+        if isinstance(post, dict) and post.get("hentet", 0) >= grænse
+    }
+
+
+def gem_cvr_cache(path: Path, cache: dict[str, dict]) -> None:
+    # dict() tager et øjebliksbillede, så workers kan blive ved med at skrive.
+    path.write_text(json.dumps(dict(cache), ensure_ascii=False), encoding="utf-8")
+
+
+def cvr_opslag(
+    session: requests.Session,
+    virksomhedsnavn: str,
+    cache: dict[str, dict] | None = None,
+) -> dict | None:
+    """Slå virksomhed op i CVR. Returnerer dict eller None.
+
+    Svar (også "ikke fundet") gemmes i `cache`; netværksfejl gemmes ikke,
+    så de prøves igen næste gang navnet dukker op.
+    """
     try:
         r = session.get(
             CVR_SEARCH_URL,
@@ -177,36 +259,191 @@ def cvr_opslag(session: requests.Session, virksomhedsnavn: str) -> dict | None:
             timeout=REQUEST_TIMEOUT,
         )
         if r.status_code == 404:
-            return None
-        r.raise_for_status()
-        d = r.json()
-        return {
-            "cvr_nummer": str(d.get("vat", "")),
-            "virksomhedsnavn": d.get("name", ""),
-            "type": d.get("companytype", ""),
-            "branche": d.get("industrydesc", ""),
-            "aktiv": d.get("enddate") is None,
-        }
+            resultat = None
+        else:
+            r.raise_for_status()
+            d = r.json()
+            resultat = {
+                "cvr_nummer": str(d.get("vat", "")),
+                "virksomhedsnavn": d.get("name", ""),
+                "type": d.get("companytype", ""),
+                "branche": d.get("industrydesc", ""),
+                "aktiv": d.get("enddate") is None,
+            }
     except Exception as exc:
         print(f"  CVR-fejl for {virksomhedsnavn!r}: {exc}", file=sys.stderr)
         return None
 
+    if cache is not None:
+        cache[cvr_nøgle(virksomhedsnavn)] = {"hentet": time.time(), "cvr": resultat}
+    return resultat
+
 
-def berig_med_cvr(session: requests.Session, poster: list[dict]) -> list[dict]:
-    """Tilføj CVR-data til poster hvor virksomhedsnavn kan uddrages."""
+def berig_med_cvr(
+    session: requests.Session,
+    poster: list[dict],
+    cvr_cache: dict[str, dict],
+) -> list[dict]:
+    """Tilføj CVR-data til poster hvor virksomhedsnavn kan uddrages.
+
+    Samme virksomhed går igen hos flere MF'ere, så kun navne der ikke
+    allerede er slået op koster et kald og en CVR_DELAY-pause.
+    """
     berigede = []
     for post in poster:
         cvr = None
-        match = re.search(r'[""«»„]([^""«»„]+)[""«»„]', post.get("beskrivelse", ""))
+        match = CITAT_PATTERN.search(post.get("beskrivelse", ""))
         if match:
-            cvr = cvr_opslag(session, match.group(1).strip())
-            if cvr:
-                print(f"    CVR: {cvr['virksomhedsnavn']} ({cvr['cvr_nummer']})")
-            time.sleep(CVR_DELAY)
+            virksomhedsnavn = match.group(1).strip()
+            nøgle = cvr_nøgle(virksomhedsnavn)
+            if nøgle in cvr_cache:
+                cvr = cvr_cache[nøgle]["cvr"]
+            else:
+                cvr = cvr_opslag(session, virksomhedsnavn, cvr_cache)
+                if cvr:
+                    print(f"    CVR: {cvr['virksomhedsnavn']} ({cvr['cvr_nummer']})")
+                time.sleep(CVR_DELAY)
         berigede.append({**post, "cvr": cvr})
     return berigede
 
 
+# ---------------------------------------------------------------------------
+# Indsamling pr. MF
+# ---------------------------------------------------------------------------
+
+def hent_mf_post(
+    page,
+    profil: dict,
+    cvr_session: requests.Session | None,
+    cvr_cache: dict[str, dict],
+    hentet: str,
+) -> dict[str, Any]:
+    """Hent og parsér #hverv for ét MF og returner posten til hverv.json."""
+    navn = profil["name"]
+    url = mf_url(profil)
+
+    hverv_html = hent_hverv_html(page, url)
+    if hverv_html is None:
+        # Skeln: CF-blocked (siden loadede aldrig) vs. siden
+        # loadede men har ingen #hverv-sektion (legitimt for
+        # nye MF'ere, afdøde MF'ere, Færø/Grønland-mandater).
+        title = ""
+        try:
+            title = page.title()
+        except Exception:
+            pass
+        cf_blokeret = "jeblik" in title or "moment" in title.lower()
+
+        if cf_blokeret:
+            print(f"  CF-blokeret: {url}", file=sys.stderr)
+            status_fejl = "CF-blokeret — prøv igen"
+        else:
+            status_fejl = None  # Ikke en fejl — siden har bare ingen sektion
+
+        return {
+            "id": profil["id"],
+            "navn": navn,
+            "registreringer": [],
+            "ingen_registreringer": True if not cf_blokeret else None,
+            "ingen_hverv_sektion": not cf_blokeret,
+            "registrering_note": (
+                None if cf_blokeret else
+                "Siden har ingen hverv-sektion. "
+                "Registreringen er frivillig."
+            ),
+            "kilde_url": url,
+            "hentet": hentet,
+            "fejl": status_fejl,
+        }
+
+    poster = parsér_hverv_html(hverv_html)
+    ingen_reg = len(poster) == 0
+
+    if cvr_session is not None and poster:
+        poster = berig_med_cvr(cvr_session, poster, cvr_cache)
+
+    return {
+        "id": profil["id"],
+        "navn": navn,
+        "registreringer": poster,
+        "ingen_registreringer": ingen_reg,
+        "registrering_note": (
+            None if poster else
+            "Ingen registreringer. Registreringen er frivillig — "
+            "dette er ikke ensbetydende med fraværet af interesser."
+        ),
+        "kilde_url": url,
+        "hentet": hentet,
+    }
+
+
+def status_tekst(entry: dict[str, Any]) -> str:
+    if entry.get("fejl"):
+        return entry["fejl"]
+    if entry.get("ingen_hverv_sektion"):
+        return "ingen hverv-sektion på siden (legitimt)"
+    if entry["registreringer"]:
+        return f"{len(entry['registreringer'])} registrering(er)"
+    return "ingen registreringer (frivilligt register)"
+
+
+def kør_worker(
+    profil_kø: queue.Queue[dict],
+    gem: Callable[[dict, dict[str, Any]], None],
+    brug_cvr: bool,
+    cvr_cache: dict[str, dict],
+    hentet: str,
+    delay: float,
+    start_delay: float = 0.0,
+) -> None:
+    """Hent MF'ere fra køen i egen fane, indtil køen er tom.
+
+    Playwrights sync-API er bundet til tråden der startede den, så hver
+    worker åbner sin egen CDP-forbindelse. Fanen oprettes i Chromes
+    standard-context, så Cloudflare-cookien fra seed-siden deles.
+    """
+    if start_delay > 0:
+        time.sleep(start_delay)
+
+    cvr_session = requests.Session() if brug_cvr else None
+    with sync_playwright() as p:
+        browser = p.chromium.connect_over_cdp(CDP_URL)
+        page = browser.contexts[0].new_page()
+        try:
+            while True:
+                try:
+                    profil = profil_kø.get_nowait()
+                except queue.Empty:
+                    break
+                gem(profil, hent_mf_post(page, profil, cvr_session, cvr_cache, hentet))
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            page.close()
+            browser.close()
+
+
+# ---------------------------------------------------------------------------
+# Løbende lagring
+# ---------------------------------------------------------------------------
+
+def indlæs_progress(path: Path) -> dict[str, Any]:
+    """Læs MF-poster skrevet løbende af en afbrudt kørsel (én JSON-linje pr. MF)."""
+    if not path.exists():
+        return {}
+
+    poster: dict[str, Any] = {}
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # En kørsel der blev dræbt midt i en skrivning efterlader en halv linje.
+                continue
+            poster[str(row["id"])] = row["entry"]
+    return poster
+
+
 # ---------------------------------------------------------------------------
 # Hoved
 # ---------------------------------------------------------------------------
@@ -214,9 +451,20 @@ def berig_med_cvr(session: requests.Session, poster: list[dict]) -> list[dict]:
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Hent hverv og CVR for Folketing-medlemmer")
     p.add_argument("--dry-run", action="store_true", help="Test mod de første 5 MF'ere")
-    p.add_argument("--delay", type=float, default=DEFAULT_DELAY, help="Sekunder mellem ft.dk-kald")
+    p.add_argument(
+        "--delay", type=float, default=DEFAULT_DELAY,
+        help="Sekunder mellem ft.dk-kald, samlet på tværs af alle faner",
+    )
+    p.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help="Antal faner der henter MF-sider parallelt",
+    )
     p.add_argument("--no-cvr", action="store_true", help="Spring CVR-opslag over")
     p.add_argument("--chrome-path", default="", help="Sti til chrome.exe")
+    p.add_argument(
+        "--fresh-profile", action="store_true",
+        help="Slet den gemte Chrome-profil (og dermed Cloudflare-cookien) før start",
+    )
     p.add_argument(
         "--retry-fejl", action="store_true",
         help="Kør kun mod MF'ere der fejlede (CF-blokeret) i forrige kørsel",
@@ -227,8 +475,13 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     args = parse_args()
 
+    # Behold kun de felter scraperen bruger, så resten af profilerne (stemmer,
+    # udvalg, biografi) ikke ligger i hukommelsen ved siden af Chrome.
     with open(PROFILER_FILE, encoding="utf-8") as f:
-        profiler: list[dict] = json.load(f)
+        profiler: list[dict] = [
+            {felt: profil[felt] for felt in PROFIL_FELTER if felt in profil} for profil in json.load(f)
+        ]
+    antal_mf = len(profiler)
 
     # Indlæs eksisterende output (bruges til --retry-fejl og crash-recovery)
     existing: dict = {}
@@ -238,6 +491,7 @@ def main() -> None:
                 existing = json.load(f).get("medlemmer", {})
         except Exception:
             pass
+    existing.update(indlæs_progress(PROGRESS_FILE))
 
     if args.retry_fejl:
         # Filtrér til kun MF'ere der er CF-blokerede i eksisterende output
@@ -260,18 +514,20 @@ def main() -> None:
     chrome_path = find_chrome(args.chrome_path)
     print(f"Chrome fundet: {chrome_path}")
 
+    # Profilen genbruges mellem kørsler, så Cloudflare-cookien overlever.
     user_data_dir = (ROOT / "tmp_chrome_hverv_profile").resolve()
-    if user_data_dir.exists():
+    if args.fresh_profile and user_data_dir.exists():
         shutil.rmtree(user_data_dir)
     user_data_dir.mkdir(parents=True, exist_ok=True)
 
     seed_url = "https://www.ft.dk/da/medlemmer/mf/i/ida-auken"
     process = start_chrome(chrome_path, user_data_dir, seed_url)
 
-    cvr_session = requests.Session()
+    # Én dato for hele kørslen, også hvis den krydser midnat.
+    i_dag = str(date.today())
     output: dict[str, Any] = {
-        "genereret": str(date.today()),
-        "antal_mf": len(json.load(open(PROFILER_FILE, encoding="utf-8"))),
+        "genereret": i_dag,
+        "antal_mf": antal_mf,
         "note": (
             "Hvervregisteret er frivilligt. Manglende registreringer betyder "
             "IKKE nødvendigvis fraværet af økonomiske interesser."
@@ -280,107 +536,85 @@ def main() -> None:
         "medlemmer": existing.copy(),
     }
 
+    # Hver færdig MF skrives som én linje, så et crash ikke kræver at hele
+    # hverv.json serialiseres igen efter hvert medlem.
+    progress = PROGRESS_FILE.open("a", encoding="utf-8")
+    skrive_lås = threading.Lock()
+    færdige = 0
+    # Deles af alle workers; et samtidigt opslag af samme navn koster højst
+    # et ekstra kald. Gemmes mellem kørsler, så --retry-fejl og næste fulde
+    # kørsel ikke slår de samme virksomheder op igen.
+    cvr_cache = indlæs_cvr_cache(CVR_CACHE_FILE)
+
+    def gem(profil: dict, entry: dict[str, Any]) -> None:
+        nonlocal færdige
+        with skrive_lås:
+            output["medlemmer"][str(profil["id"])] = entry
+            progress.write(json.dumps({"id": str(profil["id"]), "entry": entry}, ensure_ascii=False) + "\n")
+            progress.flush()
+            færdige += 1
+            print(f"[{færdige}/{total}] {profil['name']}: {status_tekst(entry)}")
+            if færdige % CVR_CACHE_SAVE_EVERY == 0:
+                gem_cvr_cache(CVR_CACHE_FILE, cvr_cache)
+
     print("Venter på Chrome starter... (8 sek)")
     time.sleep(8)
 
     try:
         with sync_playwright() as p:
-            browser = p.chromium.connect_over_cdp(f"http://127.0.0.1:{DEBUG_PORT}")
+            browser = p.chromium.connect_over_cdp(CDP_URL)
             context = browser.contexts[0]
             page = context.pages[0] if context.pages else context.new_page()
             page.wait_for_load_state("networkidle", timeout=60000)
-            print("Forbundet til Chrome via CDP. Starter indsamling...\n")
-
-            for i, profil in enumerate(profiler, 1):
-                mf_id = str(profil["id"])
-                navn = profil["name"]
-                url = mf_url(profil)
-
-                print(f"[{i}/{total}] {navn}")
-
-                hverv_html = hent_hverv_html(page, url)
-                if hverv_html is None:
-                    # Skeln: CF-blocked (siden loadede aldrig) vs. siden
-                    # loadede men har ingen #hverv-sektion (legitimt for
-                    # nye MF'ere, afdøde MF'ere, Færø/Grønland-mandater).
-                    title = ""
-                    try:
-                        title = page.title()
-                    except Exception:
-                        pass
-                    cf_blokeret = "jeblik" in title or "moment" in title.lower()
-
-                    if cf_blokeret:
-                        print(f"  CF-blokeret: {url}", file=sys.stderr)
-                        status_fejl = "CF-blokeret — prøv igen"
-                    else:
-                        print(f"  Ingen hverv-sektion på siden (legitimt): {navn}")
-                        status_fejl = None  # Ikke en fejl — siden har bare ingen sektion
-
-                    output["medlemmer"][mf_id] = {
-                        "id": profil["id"],
-                        "navn": navn,
-                        "registreringer": [],
-                        "ingen_registreringer": True if not cf_blokeret else None,
-                        "ingen_hverv_sektion": not cf_blokeret,
-                        "registrering_note": (
-                            None if cf_blokeret else
-                            "Siden har ingen hverv-sektion. "
-                            "Registreringen er frivillig."
-                        ),
-                        "kilde_url": url,
-                        "hentet": str(date.today()),
-                        "fejl": status_fejl,
-                    }
-                    # Gem løbende
-                    OUTPUT_FILE.write_text(
-                        json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8"
-                    )
-                    continue
-
-                poster = parsér_hverv_html(hverv_html)
-                ingen_reg = len(poster) == 0
-
-                if poster:
-                    print(f"  {len(poster)} registrering(er)")
-                else:
-                    print("  Ingen registreringer (frivilligt register)")
-
-                if not args.no_cvr and poster:
-                    poster = berig_med_cvr(cvr_session, poster)
-
-                output["medlemmer"][mf_id] = {
-                    "id": profil["id"],
-                    "navn": navn,
-                    "registreringer": poster,
-                    "ingen_registreringer": ingen_reg,
-                    "registrering_note": (
-                        None if poster else
-                        "Ingen registreringer. Registreringen er frivillig — "
-                        "dette er ikke ensbetydende med fraværet af interesser."
-                    ),
-                    "kilde_url": url,
-                    "hentet": str(date.today()),
-                }
-
-                # Gem løbende (crash-safe)
-                OUTPUT_FILE.write_text(
-                    json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8"
-                )
-
-                if i < total:
-                    time.sleep(args.delay)
-
             browser.close()
+        print("Forbundet til Chrome via CDP. Starter indsamling...\n")
+
+        profil_kø: queue.Queue[dict] = queue.Queue()
+        for profil in profiler:
+            profil_kø.put(profil)
+
+        antal_workers = max(1, min(args.concurrency, total))
+        with ThreadPoolExecutor(max_workers=antal_workers) as executor:
+            futures = [
+                executor.submit(
+                    kør_worker,
+                    profil_kø,
+                    gem,
+                    not args.no_cvr,
+                    cvr_cache,
+                    i_dag,
+                    # Hver fane venter delay × antal faner, forskudt med
+                    # delay, så ft.dk samlet stadig rammes én gang pr. delay.
+                    args.delay * antal_workers,
+                    args.delay * worker_index,
+                )
+                for worker_index in range(antal_workers)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Tøm køen så de andre workers stopper efter deres nuværende MF.
+                try:
+                    while True:
+                        profil_kø.get_nowait()
+                except queue.Empty:
+                    pass
+                raise
 
     finally:
+        # Saml alt der nåede at blive færdigt, også efter crash eller Ctrl+C.
+        progress.close()
+        OUTPUT_FILE.write_text(
+            json.dumps(output, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        PROGRESS_FILE.unlink(missing_ok=True)
+        gem_cvr_cache(CVR_CACHE_FILE, cvr_cache)
         process.terminate()
         try:
             process.wait(timeout=10)
         except Exception:
             process.kill()
-        if user_data_dir.exists():
-            shutil.rmtree(user_data_dir, ignore_errors=True)
 
     med_reg = sum(1 for m in output["medlemmer"].values() if m.get("registreringer"))
     print(f"\nFærdig. Skrev {OUTPUT_FILE}")
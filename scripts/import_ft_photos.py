@@ -12,16 +12,22 @@ import sys
 import time
 import unicodedata
 from pathlib import Path
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+from urllib.parse import urljoin, urlparse
 
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
-from fetch_data import extract_tag, normalize_photo_url
+from fetch_data import (
+    PAGE_SIZE,
+    FetchOptions,
+    OdaClient,
+    extract_tag,
+    fetch_actors_by_ids,
+    normalize_photo_url,
+)
 
 
-ODA_ACTOR_URL = "https://oda.ft.dk/api/Akt%C3%B8r({actor_id})?$format=json"
+ODA_DELAY = 0.2
 DEFAULT_SEED_URL = "https://www.ft.dk/medlemmer/mf/a/alex-vanopslagh"
 DEFAULT_CHROME_PATHS = (
     Path(r"C:\Program Files\Google\Chrome\Application\chrome.exe"),
@@ -34,6 +40,7 @@ PHOTO_EXTENSIONS = {
     "image/gif": ".gif",
 }
 PHOTO_CREDITS_FILENAME = "credits.json"
+PROFILE_FIELDS = ("id", "name", "member_url")
 
 
 def parse_args() -> argparse.Namespace:
@@ -47,12 +54,20 @@ def parse_args() -> argparse.Namespace:
         help="Comma-separated actor ids to process instead of the whole dataset.",
     )
     parser.add_argument("--chrome-path", default="", help="Path to chrome.exe")
+    parser.add_argument(
+        "--fresh-profile",
+        action="store_true",
+        help="Wipe the persistent Chrome profile before starting.",
+    )
     parser.add_argument("--debug-port", type=int, default=9230, help="Remote debugging port for Chrome")
     return parser.parse_args()
 
 
 def load_profiles(path: Path) -> list[dict]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    # Only keep what the importer reads; the rest of each profile would
+    # otherwise stay alive next to the Chrome session for the whole run.
+    with path.open(encoding="utf-8") as handle:
+        return [{field: profile[field] for field in PROFILE_FIELDS if field in profile} for profile in json.load(handle)]
 
 
 def load_manifest(path: Path) -> dict[str, dict]:
@@ -76,13 +91,10 @@ def discover_chrome_path(raw_path: str) -> str:
     raise FileNotFoundError("Could not find chrome.exe")
 
 
-def fetch_actor(actor_id: int) -> dict:
-    req = Request(
-        ODA_ACTOR_URL.format(actor_id=actor_id),
-        headers={"User-Agent": "folkevalget-ft-photo-importer/1.0", "Accept": "application/json"},
-    )
-    with urlopen(req, timeout=30) as response:
-        return json.load(response)
+def fetch_actors(actor_ids: list[int]) -> dict[int, dict]:
+    # One filtered ODA request per 50 actors instead of one request per profile.
+    client = OdaClient(FetchOptions(delay=ODA_DELAY, page_size=PAGE_SIZE, verbose=False))
+    return {int(actor["id"]): actor for actor in fetch_actors_by_ids(client, actor_ids=actor_ids)}
 
 
 def normalize_slug(text: str) -> str:
@@ -128,13 +140,7 @@ def candidate_member_urls(profile: dict, actor: dict) -> list[str]:
     if name_slug:
         urls.append(f"https://www.ft.dk/medlemmer/mf/{name_slug[0]}/{name_slug}")
 
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for url in urls:
-        if url not in seen:
-            deduped.append(url)
-            seen.add(url)
-    return deduped
+    return list(dict.fromkeys(urls))
 
 
 def wait_for_cdp(chrome_path: str, debug_port: int, seed_url: str, user_data_dir: Path) -> subprocess.Popen:
@@ -169,7 +175,23 @@ def extract_photographer(*values: str | None) -> str | None:
     return None
 
 
-def fetch_portrait(page, member_url: str) -> dict[str, object] | None:
+def fetch_image_direct(page, src: str) -> tuple[bytes, str | None] | None:
+    # The response listener can miss the portrait, e.g. when Chrome serves it
+    # from cache. Fetching it with the context's cookies is much cheaper than
+    # reloading the whole member page to catch it again.
+    try:
+        response = page.context.request.get(urljoin(page.url, src), timeout=20000)
+    except Exception:
+        return None
+    content_type = response.headers.get("content-type")
+    if not response.ok or not (content_type or "").startswith("image/"):
+        return None
+    return response.body(), content_type
+
+
+def capture_portrait_responses(page) -> dict[str, tuple[bytes, str | None]]:
+    # Registered once per page; adding and removing a listener for every
+    # candidate URL costs extra round trips to the browser.
     captured: dict[str, tuple[bytes, str | None]] = {}
 
     def handle_response(response) -> None:
@@ -183,6 +205,15 @@ def fetch_portrait(page, member_url: str) -> dict[str, object] | None:
             return
 
     page.on("response", handle_response)
+    return captured
+
+
+def fetch_portrait(
+    page,
+    member_url: str,
+    captured: dict[str, tuple[bytes, str | None]],
+) -> dict[str, object] | None:
+    captured.clear()
     try:
         page.goto(member_url, wait_until="networkidle", timeout=60000)
         img = page.locator("img.bio-image").first
@@ -193,6 +224,8 @@ def fetch_portrait(page, member_url: str) -> dict[str, object] | None:
         alt_text = img.get_attribute("alt")
         title_text = img.get_attribute("title")
         payload = captured.get(src)
+        if payload is None:
+            payload = fetch_image_direct(page, src)
         if payload is None:
             with page.expect_response(lambda response: response.url == src and response.request.resource_type == "image", timeout=20000) as response_info:
                 page.reload(wait_until="networkidle", timeout=60000)
@@ -215,11 +248,6 @@ def fetch_portrait(page, member_url: str) -> dict[str, object] | None:
         }
     except PlaywrightTimeoutError:
         return None
-    finally:
-        try:
-            page.remove_listener("response", handle_response)
-        except Exception:
-            pass
 
 
 def main() -> None:
@@ -235,6 +263,7 @@ def main() -> None:
         profiles = [profile for profile in profiles if profile["id"] in requested_ids]
     if args.limit > 0:
         profiles = profiles[: args.limit]
+    actor_by_id = fetch_actors(sorted({int(profile["id"]) for profile in profiles}))
 
     if temp_dir.exists():
         shutil.rmtree(temp_dir)
@@ -242,8 +271,10 @@ def main() -> None:
     if args.ids.strip() and photos_dir.exists():
         shutil.copytree(photos_dir, temp_dir, dirs_exist_ok=True)
 
+    # Kept between runs so Chrome skips first-run setup and keeps its
+    # Cloudflare clearance cookie.
     user_data_dir = Path("tmp_chrome_ft_profile").resolve()
-    if user_data_dir.exists():
+    if args.fresh_profile and user_data_dir.exists():
         shutil.rmtree(user_data_dir)
     user_data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -260,15 +291,16 @@ def main() -> None:
             context = browser.contexts[0]
             page = context.pages[0] if context.pages else context.new_page()
             page.wait_for_load_state("networkidle", timeout=60000)
+            captured = capture_portrait_responses(page)
 
             for index, profile in enumerate(profiles, start=1):
-                actor = fetch_actor(profile["id"])
+                actor = actor_by_id.get(int(profile["id"]), {})
                 urls = candidate_member_urls(profile, actor)
                 saved = False
                 last_error = ""
 
                 for member_url in urls:
-                    result = fetch_portrait(page, member_url)
+                    result = fetch_portrait(page, member_url, captured)
                     if result is None:
                         last_error = f"no portrait on {member_url}"
                         continue
@@ -310,8 +342,6 @@ def main() -> None:
             process.wait(timeout=10)
         except Exception:
             process.kill()
-        if user_data_dir.exists():
-            shutil.rmtree(user_data_dir, ignore_errors=True)
         if temp_dir.exists():
             shutil.rmtree(temp_dir, ignore_errors=True)
 